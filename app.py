@@ -16,8 +16,7 @@ def main(file: str, debug: bool) -> None:
 		logger.basicConfig(format='[%(asctime)s][%(levelname)s] %(message)s', level=logger.INFO)
 	# Application
 	pyboy = PyBoy(file)
-	while pyboy.tick():
-		pass
+	pyboy.run_until_stop()
 	pyboy.stop()	
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*- 
+#!/usr/bin/env python
+#
+# Scanline kernels for the renderer. `scanline.pyx` is the same code compiled with Cython, and is used instead when
+# it's built.
+#
+# The kernels only take flat buffers and plain integers, so Numba can compile them to native code when it's
+# installed. Numba reads `array.array` and `memoryview` through the buffer protocol, so the renderer's buffers are
+# passed as they are.
+
+try:
+    from numba import njit
+except ImportError:
+    # Without Numba, the kernels run as plain Python functions
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+COLS = 160 # Same as in lcd.py, which imports this module
+
+# Tile index for each byte in the tile map, when using signed tile indices. (x ^ 0x80 - 128) to convert to signed, then
+# add 256 for offset (reduces to + 128). The renderer imports it from here as well.
+SIGNED_TILE_INDEX = tuple((i ^ 0x80) + 128 for i in range(256))
+
+
+@njit(cache=True)
+def decode_tile(vram, tilecache, tilecache_state, t):
+    # Decodes the color codes of tile `t`, unless it's already done. This is shared by all the tile and sprite caches.
+    if tilecache_state[t]:
+        return
+    for k in range(0, 16, 2): # 2 bytes for each line
+        byte1 = vram[t*16 + k]
+        byte2 = vram[t*16 + k + 1]
+        y = (t*16 + k) // 2
+
+        for x in range(8):
+            tilecache[y*8 + x] = (((byte2 >> (7-x)) & 0b1) << 1) + ((byte1 >> (7-x)) & 0b1)
+    tilecache_state[t] = 1
+
+
+@njit(cache=True)
+def update_tile(vram, palette, tilecache, tilergba, tilecache_state, t):
+    if tilecache_state[t]:
+        return
+    decode_tile(vram, tilecache, tilecache_state, t)
+    # The final color is kept as well, so drawing the line is only a copy
+    for i in range(t*64, t*64 + 64):
+        tilergba[i] = palette[tilecache[i]]
+
+
+@njit(cache=True)
+def draw_tile_line(tilecache, tilergba, screenbuffer, attributes, row, tx, j, first, last):
+    # Copies pixel `first` up to `last` of the tile line at index `j` of the caches, to index `row + tx` of the screen.
+    # The attributes only cover the current line, so they are written from index `tx`.
+    # Numba can't slice an array.array, so this is a loop rather than a slice assignment.
+    for xx in range(first, last):
+        screenbuffer[row + tx + xx] = tilergba[j + xx]
+        # COL0_FLAG is 1
+        attributes[tx + xx] = tilecache[j + xx] == 0
+
+
+@njit(cache=True)
+def scanline_dmg(
+    vram, palette, tilecache, tilergba, tilecache_state, screenbuffer, attributes, y, bx, by, wx, wy, ly_window, lcdc
+):
+    # All VRAM addresses are offset by 0x8000
+    # Following addresses are 0x9800 and 0x9C00
+    background_offset = 0x1C00 if lcdc & 0b1000 else 0x1800
+    wmap = 0x1C00 if lcdc & 0b100_0000 else 0x1800
+    tiledata_select = lcdc & 0b1_0000
+    row = y * COLS
+
+    # The window covers the rest of the line from wx
+    if lcdc & 0b10_0000 and wy <= y:
+        window_start = min(max(wx, 0), COLS)
+    else:
+        window_start = COLS
+
+    # The line is drawn a tile at a time. The tile is looked up once, and then up to 8 pixels are copied from it. `tx`
+    # is where the tile starts on the screen, which can be left of the screen for the first tile.
+    if lcdc & 0b1:
+        tilerow = background_offset + (y+by) // 8 * 32 % 0x400
+        line = (y+by) % 8
+        # Used for the half tile at the left side when scrolling
+        offset = bx & 0b111
+        # The map row wraps around after 32 tiles
+        tile_column = bx // 8
+        for tx in range(-offset, window_start, 8):
+            t = vram[tilerow + tile_column]
+            tile_column = (tile_column+1) & 31
+            # If using signed tile indices, modify index
+            if not tiledata_select:
+                t = SIGNED_TILE_INDEX[t]
+            update_tile(vram, palette, tilecache, tilergba, tilecache_state, t)
+            draw_tile_line(
+                tilecache, tilergba, screenbuffer, attributes, row, tx, (8*t + line) * 8, max(-tx, 0),
+                min(window_start - tx, 8)
+            )
+    else:
+        # If background is disabled, it becomes white
+        for x in range(window_start):
+            screenbuffer[row + x] = palette[0]
+            attributes[x] = 0
+
+    if window_start < COLS:
+        tilerow = wmap + ly_window // 8 * 32 % 0x400
+        line = ly_window % 8
+        tile_column = 0
+        for tx in range(wx, COLS, 8):
+            t = vram[tilerow + tile_column]
+            tile_column = (tile_column+1) & 31
+            if not tiledata_select:
+                t = SIGNED_TILE_INDEX[t]
+            update_tile(vram, palette, tilecache, tilergba, tilecache_state, t)
+            draw_tile_line(
+                tilecache, tilergba, screenbuffer, attributes, row, tx, (8*t + line) * 8, max(-tx, 0),
+                min(COLS - tx, 8)
+            )
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*- 
+#!/usr/bin/env python
+# When base_mbc.py is compiled with Cython, this file turns BaseMBC into an extension type with C-typed fields. The
+# controllers in mbc1.py-mbc5.py stay Python subclasses of it. Without Cython, the __slots__ on the class are used.
+
+
+cdef class BaseMBC:
+	cdef public str filename, gamename
+	cdef public object rombanks, rombanks_flat, rambanks, rambanks_flat
+	cdef public object rtc
+	cdef public int carttype, external_rom_count, external_ram_count
+	cdef public int memorymodel, rambank_selected, rombank_selected
+	cdef public bint battery, rtc_enabled, rambank_initialized, rambank_enabled, cgb
+	# Page table, see init_read_pages
+	cdef public list _read_page
+	cdef public dict block_cache
@@ -1,15 +1,36 @@
 # -*- coding: utf-8 -*- 
 #!/usr/bin/env python
 import logging as logger
-import array
 import os
 
+import numpy as np
+
 from .rtc import RTC
 
+# logger.debug() builds its arguments even when debug output is off, so call sites on the emulation path check first
+_DEBUG = logger.DEBUG
+_debug_enabled = logger.root.isEnabledFor
+
+# The controllers decode addresses by their 8kB region, address >> 13:
+# Region: 0-1 ROM0 (writes are MBC commands), 2-3 ROMN (writes are MBC commands), 4 VRAM (never routed here), 5 ERAM
+
+# Reads from the external RAM area while it's disabled
+RAM_DISABLED_PAGES = [(memoryview(b"\xFF" * 0x2000), -0xA000)] * 0x20
+
 class BaseMBC:
+	# Same reasoning as for the CPU: the MBC is asked for every memory access outside of the internal RAM, so its
+	# state lives in fixed slots. Subclasses declare their own extra registers.
+	__slots__ = (
+		"filename", "rombanks", "rombanks_flat", "carttype", "battery", "rtc_enabled", "rtc", "rambank_initialized",
+		"external_rom_count", "external_ram_count", "rambanks", "rambanks_flat", "gamename", "memorymodel",
+		"rambank_enabled", "rambank_selected", "rombank_selected", "_read_page", "cgb",
+		"block_cache",
+	)
+
 	def __init__(self, filename, rombanks, external_ram_count, carttype, sram, battery, rtc_enabled):
 		self.filename = filename + ".ram"
 		self.rombanks = rombanks
+		self.rombanks_flat = memoryview(rombanks).cast("B")
 		self.carttype = carttype
 		self.battery = battery
 		self.rtc_enabled = rtc_enabled
@@ -26,7 +47,14 @@ class BaseMBC:
 		self.rambank_enabled = False
 		self.rambank_selected = 0
 		self.rombank_selected = 1
+		self.init_read_pages()
 		self.cgb = bool(self.getitem(0x0143) >> 7)
+		# Compiled basic blocks keyed by their location in the ROM (see core/jit.py). Only controllers reading the ROM
+		# through the page table get one, as the CPU uses the page table to tell which bank the PC points into.
+		if type(self).getitem is BaseMBC.getitem:
+			self.block_cache = {}
+		else:
+			self.block_cache = None
 	
 	def stop(self):
 		if self.rtc_enabled:
@@ -35,39 +63,66 @@ class BaseMBC:
 	def init_rambanks(self, n):
 		self.rambank_initialized = True
 		# In real life the values in RAM are scrambled on initialization.
-		# Allocating the maximum, as it is easier in Cython. And it's just 128KB...
-		self.rambanks = memoryview(array.array("B", [0] * (8*1024*16))).cast("B", shape=(16, 8 * 1024))
+		# Only the banks the cartridge has are allocated. The controllers wrap the selected bank with
+		# external_ram_count, so nothing reads or writes past them.
+		self.rambanks = np.zeros((max(1, n), 8 * 1024), dtype=np.uint8)
+		# Flat view of the same memory. Indexing it gives plain ints, which is what the CPU expects.
+		self.rambanks_flat = memoryview(self.rambanks).cast("B")
+
+	def init_read_pages(self):
+		# Page table indexed by the high byte of the address. Each entry is a (buffer, offset) pair, so a read is
+		# just buffer[address + offset]. A buffer of None means the read needs special handling (RTC or unmapped).
+		self._read_page = [(None, 0)] * 0x100
+		self._read_page[0x00:0x40] = [(self.rombanks_flat, 0)] * 0x40
+		self.update_rom_pages()
+		self.update_ram_pages()
+
+	def update_rom_pages(self):
+		# Has to be called whenever rombank_selected changes
+		self._read_page[0x40:0x80] = [(self.rombanks_flat, self.rombank_selected*0x4000 - 0x4000)] * 0x40
+
+	def update_ram_pages(self):
+		# Has to be called whenever rambank_enabled or rambank_selected changes
+		if not self.rambank_enabled:
+			self._read_page[0xA0:0xC0] = RAM_DISABLED_PAGES
+		elif self.rtc_enabled and 0x08 <= self.rambank_selected <= 0x0C:
+			self._read_page[0xA0:0xC0] = [(None, 0)] * 0x20
+		else:
+			self._read_page[0xA0:0xC0] = [(self.rambanks_flat, self.rambank_selected*0x2000 - 0xA000)] * 0x20
 
 	def getgamename(self, rombanks):
-		return "".join([chr(rombanks[0, x]) for x in range(0x0134, 0x0142)]).split("\0")[0]
+		return bytes(rombanks[0, 0x0134:0x0142]).split(b"\0", 1)[0].decode("latin-1")
 
 	def setitem(self, address, value):
 		raise Exception("Cannot set item in MBC")
 
 	def overrideitem(self, rom_bank, address, value):
-		if 0x0000 <= address < 0x4000:
-			logger.debug("Performing overwrite on address: 0x%04x:0x%04x. New value: 0x%04x Old value: 0x%04x", rom_bank, address, value, self.rombanks[rom_bank, address])
+		if address < 0x4000:
+			if _debug_enabled(_DEBUG):
+				logger.debug("Performing overwrite on address: 0x%04x:0x%04x. New value: 0x%04x Old value: 0x%04x", rom_bank, address, value, self.rombanks[rom_bank, address])
 			self.rombanks[rom_bank, address] = value
+			if self.block_cache is not None:
+				self.block_cache.clear()
 		else:
 			logger.error("Invalid override address: %0.4x", address)
 
 	def getitem(self, address):
-		if 0x0000 <= address < 0x4000:
-			return self.rombanks[0, address]
-		elif 0x4000 <= address < 0x8000:
-			return self.rombanks[self.rombank_selected, address - 0x4000]
-		elif 0xA000 <= address < 0xC000:
-			# if not self.rambank_initialized:
-			#	logger.error("RAM banks not initialized: 0.4x", address)
-			if not self.rambank_enabled:
-				return 0xFF
-			if self.rtc_enabled and 0x08 <= self.rambank_selected <= 0x0C:
-				return self.rtc.getregister(self.rambank_selected)
-			else:
-				return self.rambanks[self.rambank_selected, address - 0xA000]
+		page, offset = self._read_page[address >> 8]
+		if page is not None:
+			return page[address + offset]
+		if self.rtc_enabled and address >> 13 == 5:
+			return self.rtc.getregister(self.rambank_selected)
 		# else:
 		#	logger.error("Reading address invalid: %0.4x", address)
 
+	def getword(self, address):
+		# The motherboard makes sure both bytes are on the same page
+		page, offset = self._read_page[address >> 8]
+		if page is not None:
+			address += offset
+			return page[address] | (page[address + 1] << 8)
+		return self.getitem(address) | (self.getitem(address + 1) << 8)
+
 	def __repr__(self):
 		return "\n".join([
 			"MBC class: %s" % self.__class__.__name__,
@@ -86,13 +141,18 @@ class BaseMBC:
 
 # 只有ROM的卡带
 class ROMOnly(BaseMBC):
+	__slots__ = ()
+
 	def setitem(self, address, value):
-		if 0x2000 <= address < 0x4000:
+		region = address >> 13
+		if region == 1:
 			if value == 0:
 				value = 1
 			self.rombank_selected = (value & 0b1)
-			logger.debug("Switching bank 0x%0.4x, 0x%0.2x", address, value)
-		elif 0xA000 <= address < 0xC000:
-			self.rambanks[self.rambank_selected, address - 0xA000] = value
+			self.update_rom_pages()
+			if _debug_enabled(_DEBUG):
+				logger.debug("Switching bank 0x%0.4x, 0x%0.2x", address, value)
+		elif region == 5:
+			self.rambanks_flat[self.rambank_selected*0x2000 + address - 0xA000] = value
 		# else:
 		#	logger.debug("Unexpected write to 0x%0.4x, value: 0x%0.2x", address, value)
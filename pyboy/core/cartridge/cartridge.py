@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*- 
 #!/usr/bin/env python
 import logging as logger
-import array
+import mmap
+import os
+
+import numpy as np
 
 from .base_mbc import ROMOnly
 from .mbc1 import MBC1
@@ -15,7 +18,7 @@ def load_cartridge(filename):
         raise Exception("Cartridge header checksum mismatch!")
     # WARN: The following table doesn't work for MBC2! See Pan Docs
     external_ram_count = int(EXTERNAL_RAM_TABLE[rombanks[0, 0x0149]])
-    carttype = rombanks[0, 0x0147]
+    carttype = int(rombanks[0, 0x0147])
     cartinfo = CARTRIDGE_TABLE.get(carttype, None)
     if cartinfo is None:
         raise Exception("Catridge type invalid: %s" % carttype)
@@ -30,23 +33,26 @@ def load_cartridge(filename):
 def __validate_checksum(rombanks):
     x = 0
     for m in range(0x134, 0x14D):
-        x = x - rombanks[0, m] - 1
+        x = x - int(rombanks[0, m]) - 1
         x &= 0xff
     return rombanks[0, 0x14D] == x
 
 
 def __load_romfile(filename):
     with open(filename, "rb") as romfile:
-        romdata = array.array("B", romfile.read())
-    logger.debug("Loading ROM file: %d bytes", len(romdata))
-    if len(romdata) == 0:
-        logger.error("ROM file is empty!")
-        raise Exception("Empty ROM file")
-    banksize = 16 * 1024
-    if len(romdata) % banksize != 0:
-        logger.error("Unexpected ROM file length")
-        raise Exception("Bad ROM file size")
-    return memoryview(romdata).cast("B", shape=(len(romdata) // banksize, banksize))
+        size = os.fstat(romfile.fileno()).st_size
+        logger.debug("Loading ROM file: %d bytes", size)
+        if size == 0:
+            logger.error("ROM file is empty!")
+            raise Exception("Empty ROM file")
+        banksize = 16 * 1024
+        if size % banksize != 0:
+            logger.error("Unexpected ROM file length")
+            raise Exception("Bad ROM file size")
+        # The ROM is mapped instead of read, so banks are only paged in when the game uses them. The mapping is
+        # copy-on-write, which lets overrideitem patch the ROM without touching the file.
+        romdata = mmap.mmap(romfile.fileno(), 0, access=mmap.ACCESS_COPY)
+    return np.frombuffer(romdata, dtype=np.uint8).reshape(size // banksize, banksize)
 
 CARTRIDGE_TABLE = {
     #      MBC     , SRAM  , Battery , RTC
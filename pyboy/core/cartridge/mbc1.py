@@ -5,44 +5,48 @@ import logging as logger
 from .base_mbc import BaseMBC
 
 class MBC1(BaseMBC):
+    __slots__ = ("bank_select_register1", "bank_select_register2")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.bank_select_register1 = 1
         self.bank_select_register2 = 0
 
     def setitem(self, address, value):
-        if 0x0000 <= address < 0x2000:
+        region = address >> 13
+        if region == 0:
             self.rambank_enabled = (value & 0b00001111) == 0b1010
-        elif 0x2000 <= address < 0x4000:
+        elif region == 1:
             value &= 0b00011111
             # The register cannot contain zero (0b00000) and will be initialized as 0b00001
             # Attempting to write 0b00000 will write 0b00001 instead.
             if value == 0:
                 value = 1
             self.bank_select_register1 = value
-        elif 0x4000 <= address < 0x6000:
+        elif region == 2:
             self.bank_select_register2 = value & 0b11
-        elif 0x6000 <= address < 0x8000:
+        elif region == 3:
             self.memorymodel = value & 0b1
-        elif 0xA000 <= address < 0xC000:
+        elif region == 5:
             if self.rambank_enabled:
                 self.rambank_selected = self.bank_select_register2 if self.memorymodel == 1 else 0
-                self.rambanks[self.rambank_selected % self.external_ram_count, address - 0xA000] = value
+                self.rambanks_flat[(self.rambank_selected % self.external_ram_count)*0x2000 + address - 0xA000] = value
         # else:
         #     logger.error("Invalid writing address: %0.4x", address)
 
     def getitem(self, address):
-        if 0x0000 <= address < 0x4000:
+        region = address >> 13
+        if region < 2:
             if self.memorymodel == 1:
                 self.rombank_selected = (self.bank_select_register2 << 5) % self.external_rom_count
             else:
                 self.rombank_selected = 0
-            return self.rombanks[self.rombank_selected, address]
-        elif 0x4000 <= address < 0x8000:
+            return self.rombanks_flat[self.rombank_selected*0x4000 + address]
+        elif region < 4:
             self.rombank_selected = \
                     ((self.bank_select_register2 << 5) | self.bank_select_register1) % self.external_rom_count
-            return self.rombanks[self.rombank_selected, address - 0x4000]
-        elif 0xA000 <= address < 0xC000:
+            return self.rombanks_flat[self.rombank_selected*0x4000 + address - 0x4000]
+        elif region == 5:
             if not self.rambank_initialized:
                 logger.error("RAM banks not initialized: %0.4x", address)
 
@@ -53,7 +57,11 @@ class MBC1(BaseMBC):
                 self.rambank_selected = self.bank_select_register2 % self.external_ram_count
             else:
                 self.rambank_selected = 0
-            return self.rambanks[self.rambank_selected, address - 0xA000]
+            return self.rambanks_flat[self.rambank_selected*0x2000 + address - 0xA000]
         # else:
         #     logger.error("Reading address invalid: %0.4x", address)
 
+    def getword(self, address):
+        # Doesn't use the page table, so it has to go through getitem
+        return self.getitem(address) | (self.getitem(address + 1) << 8)
+
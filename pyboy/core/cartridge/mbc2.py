@@ -6,8 +6,11 @@ from .base_mbc import BaseMBC
 
 
 class MBC2(BaseMBC):
+    __slots__ = ()
+
     def setitem(self, address, value):
-        if 0x0000 <= address < 0x4000:
+        region = address >> 13
+        if region < 2:
             value &= 0b00001111
             if ((address & 0x100) == 0):
                 self.rambank_enabled = (value == 0b00001010)
@@ -15,19 +18,20 @@ class MBC2(BaseMBC):
                 if value == 0:
                     value = 1
                 self.rombank_selected = value % self.external_rom_count
-        elif 0xA000 <= address < 0xC000:
+        elif region == 5:
             if self.rambank_enabled:
                 # MBC2 includes built-in RAM of 512 x 4 bits (Only the 4 LSBs are used)
-                self.rambanks[0, address % 512] = value | 0b11110000
+                self.rambanks_flat[address % 512] = value | 0b11110000
         # else:
         #     logger.debug("Unexpected write to 0x%0.4x, value: 0x%0.2x", address, value)
 
     def getitem(self, address):
-        if 0x0000 <= address < 0x4000:
-            return self.rombanks[0, address]
-        elif 0x4000 <= address < 0x8000:
-            return self.rombanks[self.rombank_selected, address - 0x4000]
-        elif 0xA000 <= address < 0xC000:
+        region = address >> 13
+        if region < 2:
+            return self.rombanks_flat[address]
+        elif region < 4:
+            return self.rombanks_flat[self.rombank_selected*0x4000 + address - 0x4000]
+        elif region == 5:
             if not self.rambank_initialized:
                 logger.error("RAM banks not initialized: %0.4x", address)
 
@@ -35,6 +39,10 @@ class MBC2(BaseMBC):
                 return 0xFF
 
             else:
-                return self.rambanks[0, address % 512] | 0b11110000
+                return self.rambanks_flat[address % 512] | 0b11110000
         # else:
         #     logger.error("Reading address invalid: %0.4x", address)
+
+    def getword(self, address):
+        # Doesn't use the page table, so it has to go through getitem
+        return self.getitem(address) | (self.getitem(address + 1) << 8)
@@ -2,23 +2,31 @@
 #!/usr/bin/env python
 import logging as logger
 
-from .base_mbc import BaseMBC
+from .base_mbc import _DEBUG, BaseMBC, _debug_enabled
 
 class MBC5(BaseMBC):
+    __slots__ = ()
+
     def setitem(self, address, value):
-        if 0x0000 <= address < 0x2000:
+        region = address >> 13
+        if region == 0:
             # 8-bit register. All bits matter, so only 0b00001010 enables RAM.
             self.rambank_enabled = (value == 0b00001010)
-        elif 0x2000 <= address < 0x3000:
-            # 8-bit register used for the lower 8 bits of the ROM bank number.
-            self.rombank_selected = ((self.rombank_selected & 0b100000000) | value) % self.external_rom_count
-        elif 0x3000 <= address < 0x4000:
-            # 1-bit register used for the most significant bit of the ROM bank number.
-            self.rombank_selected = (((value & 0x1) << 8) | (self.rombank_selected & 0xFF)) % self.external_rom_count
-        elif 0x4000 <= address < 0x6000:
+            self.update_ram_pages()
+        elif region == 1:
+            if address < 0x3000:
+                # 8-bit register used for the lower 8 bits of the ROM bank number.
+                self.rombank_selected = ((self.rombank_selected & 0b100000000) | value) % self.external_rom_count
+            else:
+                # 1-bit register used for the most significant bit of the ROM bank number.
+                self.rombank_selected = (((value & 0x1) << 8) | (self.rombank_selected & 0xFF)) % self.external_rom_count
+            self.update_rom_pages()
+        elif region == 2:
             self.rambank_selected = (value & 0xF) % self.external_ram_count
-        elif 0xA000 <= address < 0xC000:
+            self.update_ram_pages()
+        elif region == 5:
             if self.rambank_enabled:
-                self.rambanks[self.rambank_selected, address - 0xA000] = value
+                self.rambanks_flat[self.rambank_selected*0x2000 + address - 0xA000] = value
         else:
-            logger.debug("Unexpected write to 0x%0.4x, value: 0x%0.2x", address, value)
+            if _debug_enabled(_DEBUG):
+                logger.debug("Unexpected write to 0x%0.4x, value: 0x%0.2x", address, value)
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*- 
+#!/usr/bin/env python
+# When cpu.py is compiled with Cython, this file turns CPU into an extension type with C-typed fields. The pure
+# Python module keeps working without it, using the __slots__ declared on the class.
+from libc.stdint cimport uint8_t, uint16_t
+
+
+cdef class CPU:
+	cdef public uint8_t A, F, B, C, D, E
+	cdef public uint16_t HL, SP, PC
+
+	cdef public uint8_t interrupts_flag_register, interrupts_enabled_register
+	cdef public bint interrupt_master_enable, interrupt_queued
+
+	cdef public object mb
+	cdef readonly object _mb_get, _mb_getword, _mb_set
+	cdef object _block_cache, _read_page
+
+	cdef public bint halted, stopped, is_stuck
@@ -5,14 +5,25 @@ import array
 
 from pyboy import utils
 
-from . import opcodes
+from . import jit
+from .lcd import FRAME_CYCLES
+from .opcodes import OP_CAN_LOOP, execute_opcode
 
 FLAGC, FLAGH, FLAGN, FLAGZ = range(4, 8)
 INTR_VBLANK, INTR_LCDC, INTR_TIMER, INTR_SERIAL, INTR_HIGHTOLOW = [1 << x for x in range(5)]
+INTR_VECTORS = (0x0040, 0x0048, 0x0050, 0x0058, 0x0060) # Indexed by interrupt bit
 
 import pyboy
 
 class CPU:
+	# The register file and the rest of the CPU state live in fixed slots instead of a per-instance __dict__. The
+	# opcode handlers touch several of these on every instruction.
+	__slots__ = (
+		"A", "F", "B", "C", "D", "E", "HL", "SP", "PC",
+		"interrupts_flag_register", "interrupts_enabled_register", "interrupt_master_enable", "interrupt_queued",
+		"mb", "_mb_get", "_mb_getword", "_mb_set", "_block_cache", "_read_page", "halted", "stopped", "is_stuck",
+	)
+
 	def set_bc(self, x):
 		self.B = x >> 8
 		self.C = x & 0x00FF
@@ -38,6 +49,14 @@ class CPU:
 		self.interrupt_queued = False
 
 		self.mb = mb
+		# Bound methods for the memory accesses done on every instruction. The motherboard is never swapped out.
+		self._mb_get = mb.getitem
+		self._mb_getword = mb.getword
+		self._mb_set = mb.setitem
+		# Basic blocks are cached on the cartridge, as they are compiled from its ROM. The page table is updated in
+		# place on bank switches, so holding on to it is safe.
+		self._block_cache = mb.cartridge.block_cache
+		self._read_page = mb.cartridge._read_page
 
 		self.halted = False
 		self.stopped = False
@@ -57,17 +76,17 @@ class CPU:
 			# WARNING: The instruction immediately following the HALT instruction is "skipped" when interrupts are
 			# disabled (DI) on the GB,GBP, and SGB.
 			self.halted = False
-			self.PC += 1
-			self.PC &= 0xFFFF
+			self.PC = (self.PC + 1) & 0xFFFF
 		elif self.halted:
 			return 4 # TODO: Number of cycles for a HALT in effect?
 
-		old_pc = self.PC # If the PC doesn't change, we're likely stuck
-		old_sp = self.SP # Sometimes a RET can go to the same PC, so we check the SP too.
+		if self._block_cache is not None and self.PC < 0x8000:
+			cycles = self.run_block()
+			if cycles:
+				self.interrupt_queued = False
+				return cycles
+
 		cycles = self.fetch_and_execute()
-		if not self.halted and old_pc == self.PC and old_sp == self.SP and not self.is_stuck and not self.mb.breakpoint_singlestep:
-			logger.debug("CPU is stuck: %s", self.dump_state(""))
-			self.is_stuck = True
 		self.interrupt_queued = False
 		return cycles
 
@@ -76,48 +95,73 @@ class CPU:
 			# Interrupt already queued. This happens only when using a debugger.
 			return False
 
-		if (self.interrupts_flag_register & 0b11111) & (self.interrupts_enabled_register & 0b11111):
-			if self.handle_interrupt(INTR_VBLANK, 0x0040):
-				self.interrupt_queued = True
-			elif self.handle_interrupt(INTR_LCDC, 0x0048):
-				self.interrupt_queued = True
-			elif self.handle_interrupt(INTR_TIMER, 0x0050):
-				self.interrupt_queued = True
-			elif self.handle_interrupt(INTR_SERIAL, 0x0058):
-				self.interrupt_queued = True
-			elif self.handle_interrupt(INTR_HIGHTOLOW, 0x0060):
-				self.interrupt_queued = True
-			else:
-				logger.error("No interrupt triggered, but it should!")
-				self.interrupt_queued = False
-			return True
-		else:
+		pending = self.interrupts_flag_register & self.interrupts_enabled_register & 0b11111
+		if not pending:
 			self.interrupt_queued = False
-		return False
+			return False
+
+		# The lowest set bit has the highest priority
+		idx = (pending & -pending).bit_length() - 1
+		self.handle_interrupt(1 << idx, INTR_VECTORS[idx])
+		self.interrupt_queued = True
+		return True
 
 	def handle_interrupt(self, flag, addr):
-		if (self.interrupts_enabled_register & flag) and (self.interrupts_flag_register & flag):
-			# Clear interrupt flag
-			if self.halted:
-				self.PC += 1 # Escape HALT on return
-				self.PC &= 0xFFFF
-			# Handle interrupt vectors
-			if self.interrupt_master_enable:
-				self.interrupts_flag_register ^= flag # Remove flag
-				self.mb.setitem((self.SP - 1) & 0xFFFF, self.PC >> 8) # High
-				self.mb.setitem((self.SP - 2) & 0xFFFF, self.PC & 0xFF) # Low
-				self.SP -= 2
-				self.SP &= 0xFFFF
-
-				self.PC = addr
-				self.interrupt_master_enable = False
-			return True
-		return False
+		# The caller has already checked that the interrupt is both requested and enabled
+		if self.halted:
+			self.PC = (self.PC + 1) & 0xFFFF # Escape HALT on return
+		# Handle interrupt vectors
+		if self.interrupt_master_enable:
+			self.interrupts_flag_register ^= flag # Remove flag
+			self._mb_set((self.SP - 1) & 0xFFFF, self.PC >> 8) # High
+			self._mb_set((self.SP - 2) & 0xFFFF, self.PC & 0xFF) # Low
+			self.SP = (self.SP - 2) & 0xFFFF
+
+			self.PC = addr
+			self.interrupt_master_enable = False
+
+	def run_block(self):
+		# Returns the cycles spent, or 0 if the instruction at PC has to go through fetch_and_execute
+		mb = self.mb
+		if mb.bootrom_enabled or mb.breakpoint_singlestep:
+			return 0
+
+		pc = self.PC
+		rom, offset = self._read_page[pc >> 8]
+		# Location in the ROM, and whether it's mapped as bank 0 or the switchable bank. Some controllers can map
+		# bank 0 into both.
+		key = ((pc + offset) << 1) | (pc >> 14)
+		block = self._block_cache.get(key, False)
+		if block is False:
+			block = jit.compile_block(rom, offset, pc)
+			self._block_cache[key] = block
+		if block is None:
+			return 0
+
+		run, max_cycles = block
+		# The motherboard only catches up the LCD and the timer after the block. So the block is only run when neither
+		# of them would change state before it's done, which also means no interrupt can come in halfway.
+		lcd = mb.lcd
+		if lcd.clock + max_cycles >= (lcd.clock_target if lcd._LCDC.value & 0b1000_0000 else FRAME_CYCLES):
+			return 0
+		timer = mb.timer
+		if timer.TAC & 0b100 and timer.TIMA_counter + max_cycles >= timer.dividers[timer.TAC & 0b11]:
+			return 0
+		return run(self)
 
 	def fetch_and_execute(self):
-		opcode = self.mb.getitem(self.PC)
+		opcode = self._mb_get(self.PC)
 		if opcode == 0xCB: # Extension code
-			opcode = self.mb.getitem(self.PC + 1)
-			opcode += 0x100 # Internally shifting look-up table
-		return opcodes.execute_opcode(self, opcode)
+			# Internally shifting look-up table
+			opcode = 0x100 | (self._mb_getword(self.PC) >> 8)
+		if OP_CAN_LOOP[opcode]:
+			# Only these instructions can leave PC where it was, so the stuck check is limited to them
+			old_pc = self.PC # If the PC doesn't change, we're likely stuck
+			old_sp = self.SP # Sometimes a RET can go to the same PC, so we check the SP too.
+			cycles = execute_opcode(self, opcode)
+			if not self.halted and old_pc == self.PC and old_sp == self.SP and not self.is_stuck and not self.mb.breakpoint_singlestep:
+				logger.debug("CPU is stuck: PC 0x%04x, SP 0x%04x", self.PC, self.SP)
+				self.is_stuck = True
+			return cycles
+		return execute_opcode(self, opcode)
 
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python
+# Basic block compiler for code running from the cartridge ROM.
+#
+# A block is a straight run of instructions that only read and write CPU registers, optionally closed by a jump. It
+# is decoded once, turned into a single Python function calling the opcode handlers back to back, and cached by its
+# location in the ROM. Running a block replaces one motherboard loop iteration per instruction with one per block.
+
+from .opcodes import OPCODE_ADVANCE, OPCODE_CYCLES, OPCODE_LENGTHS, OPCODE_TABLE
+
+MIN_BLOCK_LENGTH = 2
+MAX_BLOCK_LENGTH = 32
+
+# Instructions which touch nothing but the registers. Anything reading or writing memory, the stack or the interrupt
+# state (EI, DI, HALT, STOP) ends a block, as do the illegal opcodes.
+REGISTER_OPCODES = set([
+	0x00, # NOP
+	0x01, 0x11, 0x21, 0x31, # LD rr,d16
+	0x03, 0x13, 0x23, 0x33, 0x0B, 0x1B, 0x2B, 0x3B, # INC rr, DEC rr
+	0x09, 0x19, 0x29, 0x39, # ADD HL,rr
+	0x07, 0x0F, 0x17, 0x1F, 0x27, 0x2F, 0x37, 0x3F, # RLCA, RRCA, RLA, RRA, DAA, CPL, SCF, CCF
+	0xC6, 0xCE, 0xD6, 0xDE, 0xE6, 0xEE, 0xF6, 0xFE, # ALU A,d8
+	0xE8, 0xF8, 0xF9, # ADD SP,r8, LD HL,SP+r8, LD SP,HL
+])
+for _r in range(8):
+	if _r != 6: # (HL)
+		REGISTER_OPCODES.update((0x04 | _r << 3, 0x05 | _r << 3, 0x06 | _r << 3)) # INC r, DEC r, LD r,d8
+REGISTER_OPCODES.update(op for op in range(0x40, 0x80) if op & 0x7 != 6 and (op >> 3) & 0x7 != 6) # LD r,r
+REGISTER_OPCODES.update(op for op in range(0x80, 0xC0) if op & 0x7 != 6) # ALU A,r
+REGISTER_OPCODES.update(op for op in range(0x100, 0x200) if op & 0x7 != 6) # CB-prefixed on r
+
+# Jumps with a target known at decode time. They end a block. The value is the number of extra cycles when taken.
+JUMP_OPCODES = {
+	0x18: 0, 0x20: 4, 0x28: 4, 0x30: 4, 0x38: 4, # JR
+	0xC3: 0, 0xC2: 4, 0xCA: 4, 0xD2: 4, 0xDA: 4, # JP
+}
+
+
+def compile_block(rom, offset, pc):
+	"""
+	Decodes the block starting at `pc`, reading the instructions from `rom[pc + offset]`. Returns a pair of the
+	compiled block and the most cycles it can take, or None if too few instructions qualify.
+	"""
+	start = pc
+	end = (pc & 0xC000) + 0x4000 # Don't run off the end of the bank
+	namespace = {}
+	calls = []
+	cycles = 0
+	extra = 0
+	while len(calls) < MAX_BLOCK_LENGTH:
+		opcode = rom[pc + offset]
+		if opcode == 0xCB:
+			if pc + 1 >= end:
+				break
+			opcode = rom[pc + 1 + offset] + 0x100
+		size = OPCODE_ADVANCE[opcode]
+		if pc + size > end:
+			break
+
+		jump = opcode in JUMP_OPCODES
+		if not jump and opcode not in REGISTER_OPCODES:
+			break
+
+		oplen = OPCODE_LENGTHS[opcode]
+		if oplen == 2:
+			arg = rom[pc + 1 + offset]
+		elif oplen == 3:
+			arg = (rom[pc + 2 + offset] << 8) + rom[pc + 1 + offset]
+
+		if jump:
+			if opcode < 0x40:
+				target = (pc + size + ((arg ^ 0x80) - 0x80)) & 0xFFFF
+			else:
+				target = arg
+			if target == pc:
+				# Leave a jump onto itself to the interpreter, so it is caught as stuck
+				break
+
+		name = "op%d" % len(calls)
+		namespace[name] = OPCODE_TABLE[opcode]
+		if oplen == 1:
+			calls.append("%s(cpu)" % name)
+		else:
+			calls.append("%s(cpu, 0x%04X)" % (name, arg))
+		cycles += OPCODE_CYCLES[opcode]
+		pc += size
+
+		if jump:
+			extra = JUMP_OPCODES[opcode]
+			break
+
+	if len(calls) < MIN_BLOCK_LENGTH:
+		return None
+
+	lines = ["def block(cpu):"]
+	lines.extend("\t" + call for call in calls[:-1])
+	# Only a jump looks at PC, so it's enough to set it once before the last instruction.
+	lines.append("\tcpu.PC = 0x%04X" % pc)
+	lines.append("\treturn %d + %s" % (cycles, calls[-1]))
+	exec(compile("\n".join(lines), "<block 0x%04X>" % start, "exec"), namespace)
+	return namespace["block"], cycles + extra
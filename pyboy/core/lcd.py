@@ -3,12 +3,17 @@
 import logging as logger
 import array
 
-from random import getrandbits
-from ctypes import c_void_p
-from copy import deepcopy
+from random import randbytes
+
+import numpy as np
 
 from .register import *
 
+try:
+    from .scanline import SIGNED_TILE_INDEX, decode_tile, scanline_dmg, update_tile
+except ImportError:
+    from ._scanline import SIGNED_TILE_INDEX, decode_tile, scanline_dmg, update_tile
+
 VIDEO_RAM = 8 * 1024 # 8KB
 OBJECT_ATTRIBUTE_MEMORY = 0xA0
 INTR_VBLANK, INTR_LCDC, INTR_TIMER, INTR_SERIAL, INTR_HIGHTOLOW = [1 << x for x in range(5)]
@@ -26,15 +31,11 @@ def rgb_to_bgr(color):
 
 class LCD:
     def __init__(self, cgb, cartridge_cgb, color_palette, cgb_color_palette, randomize=False):
-        self.VRAM0 = array.array("B", [0] * VIDEO_RAM)
-        self.OAM = array.array("B", [0] * OBJECT_ATTRIBUTE_MEMORY)
+        # Zeroed, or random when randomizing
+        initial = randbytes if randomize else bytes
+        self.VRAM0 = array.array("B", initial(VIDEO_RAM))
+        self.OAM = array.array("B", initial(OBJECT_ATTRIBUTE_MEMORY))
         self.disable_renderer = False
-        # randmon init
-        if randomize:
-            for i in range(VIDEO_RAM):
-                self.VRAM0[i] = getrandbits(8)
-            for i in range(OBJECT_ATTRIBUTE_MEMORY):
-                self.OAM[i] = getrandbits(8)
         # register
         self._LCDC = LCDCRegister(0)
         self._STAT = STATRegister() # Bit 7 is always set.
@@ -53,6 +54,7 @@ class LCD:
         self.clock_target = 0
         self.frame_done = False
         self.double_speed = False
+        self._mode_handlers = (self._tick_mode0, self._tick_mode1, self._tick_mode2, self._tick_mode3)
         self.cgb = cgb
         if self.cgb:
             if cartridge_cgb:
@@ -78,7 +80,7 @@ class LCD:
 
     def set_lcdc(self, value):
         self._LCDC.set(value)
-        if not self._LCDC.lcd_enable:
+        if not value & 0b1000_0000: # LCD enable
             # https://www.reddit.com/r/Gameboy/comments/a1c8h0/what_happens_when_a_gameboy_screen_is_disabled/
             # 1. LY (current rendering line) resets to zero. A few games rely on this behavior, namely Mr. Do! When LY
             # is reset to zero, no LYC check is done, so no STAT interrupt happens either.
@@ -129,7 +131,7 @@ class LCD:
         interrupt_flag = 0
         self.clock += cycles
 
-        if self._LCDC.lcd_enable:
+        if self._LCDC.value & 0b1000_0000: # LCD enable
             if self.clock >= self.clock_target:
                 # Change to next mode
                 interrupt_flag |= self._STAT.set_mode(self.next_stat_mode)
@@ -140,48 +142,9 @@ class LCD:
                 #   Mode 3  _33____33____33____33____33____33__________________3___
                 #   Mode 0  ___000___000___000___000___000___000________________000
                 #   Mode 1  ____________________________________11111111111111_____
-                multiplier = 2 if self.double_speed else 1
-
                 # LCD state machine
-                if self._STAT._mode == 2: # Searching OAM
-                    if self.LY == 153:
-                        self.LY = 0
-                        self.clock %= FRAME_CYCLES
-                        self.clock_target %= FRAME_CYCLES
-                    else:
-                        self.LY += 1
-
-                    self.clock_target += 80 * multiplier
-                    self.next_stat_mode = 3
-                    interrupt_flag |= self._STAT.update_LYC(self.LYC, self.LY)
-                elif self._STAT._mode == 3:
-                    self.clock_target += 170 * multiplier
-                    self.next_stat_mode = 0
-                elif self._STAT._mode == 0: # HBLANK
-                    self.clock_target += 206 * multiplier
-
-                    self.renderer.scanline(self, self.LY)
-                    self.renderer.scanline_sprites(
-                        self, self.LY, self.renderer._screenbuffer, self.renderer._screenbuffer_attributes, False
-                    )
-                    if self.LY < 143:
-                        self.next_stat_mode = 2
-                    else:
-                        self.next_stat_mode = 1
-                elif self._STAT._mode == 1: # VBLANK
-                    self.clock_target += 456 * multiplier
-                    self.next_stat_mode = 1
-
-                    self.LY += 1
-                    interrupt_flag |= self._STAT.update_LYC(self.LYC, self.LY)
-
-                    if self.LY == 144:
-                        interrupt_flag |= INTR_VBLANK
-                        self.frame_done = True
-
-                    if self.LY == 153:
-                        # Reset to new frame and start from mode 2
-                        self.next_stat_mode = 2
+                multiplier = 2 if self.double_speed else 1
+                interrupt_flag |= self._mode_handlers[self._STAT._mode & 0b11](multiplier)
         else:
             # See also `self.set_lcdc`
             if self.clock >= FRAME_CYCLES:
@@ -193,6 +156,53 @@ class LCD:
 
         return interrupt_flag
 
+    # Handlers for the mode the LCD has just entered, indexed by the mode number. Each one schedules the next mode and
+    # returns the interrupts raised.
+
+    def _tick_mode0(self, multiplier): # HBLANK
+        self.clock_target += 206 * multiplier
+
+        self.renderer.render_scanline(self, self.LY)
+        if self.LY < 143:
+            self.next_stat_mode = 2
+        else:
+            self.next_stat_mode = 1
+        return 0
+
+    def _tick_mode1(self, multiplier): # VBLANK
+        self.clock_target += 456 * multiplier
+        self.next_stat_mode = 1
+
+        LY = self.LY + 1
+        self.LY = LY
+        interrupt_flag = self._STAT.update_LYC(self.LYC, LY)
+
+        if LY == 144:
+            interrupt_flag |= INTR_VBLANK
+            self.frame_done = True
+
+        if LY == 153:
+            # Reset to new frame and start from mode 2
+            self.next_stat_mode = 2
+        return interrupt_flag
+
+    def _tick_mode2(self, multiplier): # Searching OAM
+        if self.LY == 153:
+            self.LY = 0
+            self.clock %= FRAME_CYCLES
+            self.clock_target %= FRAME_CYCLES
+        else:
+            self.LY += 1
+
+        self.clock_target += 80 * multiplier
+        self.next_stat_mode = 3
+        return self._STAT.update_LYC(self.LYC, self.LY)
+
+    def _tick_mode3(self, multiplier):
+        self.clock_target += 170 * multiplier
+        self.next_stat_mode = 0
+        return 0
+
     def getwindowpos(self):
         return (self.WX - 7, self.WY)
 
@@ -203,6 +213,19 @@ class LCD:
 COL0_FLAG = 0b01
 BG_PRIORITY_FLAG = 0b10
 
+# Decoded CGB background map attributes for each byte in VRAM bank 1: palette, vbank, horiflip, vertflip, bg_priority
+_CGB_MAP_ATTRIBUTES = tuple(
+    (b & 0b111, (b >> 3) & 1, (b >> 5) & 1, (b >> 6) & 1, (b >> 7) & 1) for b in range(256)
+)
+
+_BITS = np.arange(7, -1, -1, dtype=np.uint8)
+
+def _decode_tiles(vram, tiles):
+    """Decodes the color codes of the given tiles at once. `vram` is the tile data in shape (TILES, 8, 2), and the
+    result is in shape (len(tiles), 8, 8)."""
+    b = vram[tiles]
+    return (((b[:, :, 1, None] >> _BITS) & 0b1) << 1) | ((b[:, :, 0, None] >> _BITS) & 0b1)
+
 class Renderer:
     def __init__(self, cgb):
         self.cgb = cgb
@@ -214,192 +237,212 @@ class Renderer:
         # self.tiles_changed0 = set([])
 
         # Init buffers as white
-        self._screenbuffer_raw = array.array("B", [0x00] * (ROWS*COLS*4))
-        self._screenbuffer_attributes_raw = array.array("B", [0x00] * (ROWS*COLS))
-        self._tilecache0_raw = array.array("B", [0x00] * (TILES*8*8*4))
-        self._spritecache0_raw = array.array("B", [0x00] * (TILES*8*8*4))
-        self._spritecache1_raw = array.array("B", [0x00] * (TILES*8*8*4))
-        self.sprites_to_render = array.array("i", [0] * 10)
-
-        self._tilecache0_state = array.array("B", [0] * TILES)
-        self._spritecache0_state = array.array("B", [0] * TILES)
-        self._spritecache1_state = array.array("B", [0] * TILES)
+        self._screenbuffer_raw = array.array("B", bytes(ROWS*COLS*4))
+        # Per pixel information from the background and window to the sprites. It's only needed while drawing a line.
+        self._line_attributes = array.array("B", bytes(COLS))
+        self._tilecache0_raw = array.array("B", bytes(TILES*8*8*4))
+        # Tile cache above with the background palette applied. It's cleared together with the tile cache, which
+        # also happens on writes to BGP.
+        self._tilergba0 = array.array("I", bytes(4 * (TILES*8*8)))
+        self._spritecache0_raw = array.array("B", bytes(TILES*8*8*4))
+        self._spritecache1_raw = array.array("B", bytes(TILES*8*8*4))
+        self.sprites_to_render = array.array("i", bytes(4 * 10))
+
+        self._tilecache0_state = array.array("B", bytes(TILES))
+        self._spritecache0_state = array.array("B", bytes(TILES))
+        self._spritecache1_state = array.array("B", bytes(TILES))
+        # Background tiles invalidated since the last frame. They are decoded together, when the next frame starts.
+        self.dirty_tiles = set()
+        # Bumped on every change to VRAM, OAM or the palettes, and when the screen is blanked. The inputs of each line
+        # when it was last drawn are kept to skip drawing it again.
+        self._vram_generation = 0
+        self._scanline_inputs = [None] * ROWS
         self.clear_cache()
 
         self._screenbuffer = memoryview(self._screenbuffer_raw).cast("I", shape=(ROWS, COLS))
-        self._screenbuffer_attributes = memoryview(self._screenbuffer_attributes_raw).cast("B", shape=(ROWS, COLS))
         self._tilecache0 = memoryview(self._tilecache0_raw).cast("I", shape=(TILES * 8, 8))
         # OBP0 palette
         self._spritecache0 = memoryview(self._spritecache0_raw).cast("I", shape=(TILES * 8, 8))
         # OBP1 palette
         self._spritecache1 = memoryview(self._spritecache1_raw).cast("I", shape=(TILES * 8, 8))
-        self._screenbuffer_ptr = c_void_p(self._screenbuffer_raw.buffer_info()[0])
+        # Plain address of the screen buffer. ctypes converts it where a void pointer is expected.
+        self._screenbuffer_ptr = self._screenbuffer_raw.buffer_info()[0]
+        # 1D views for the scanline and tile decoding kernels
+        self._screenbuffer_flat = memoryview(self._screenbuffer_raw).cast("I")
+        self._tilecache0_flat = memoryview(self._tilecache0_raw).cast("I")
+        self._spritecache0_flat = memoryview(self._spritecache0_raw).cast("I")
+        self._spritecache1_flat = memoryview(self._spritecache1_raw).cast("I")
+        # NumPy views for filling the screen and decoding many tiles at once. Single pixels are still written through
+        # the memoryviews above, as indexing a memoryview is quicker than indexing an ndarray.
+        self._screenbuffer_np = np.frombuffer(self._screenbuffer_raw, dtype=np.uint32).reshape(ROWS, COLS)
+        self._tilecache0_np = np.frombuffer(self._tilecache0_raw, dtype=np.uint32).reshape(TILES, 8, 8)
+        self._tilergba0_np = np.frombuffer(self._tilergba0, dtype=np.uint32).reshape(TILES, 8, 8)
+        self._tilecache0_state_np = np.frombuffer(self._tilecache0_state, dtype=np.uint8)
 
         self._scanlineparameters = [[0, 0, 0, 0, 0] for _ in range(ROWS)]
         self.ly_window = 0
 
     def _cgb_get_background_map_attributes(self, lcd, i):
-        tile_num = lcd.VRAM1[i]
-        palette = tile_num & 0b111
-        vbank = (tile_num >> 3) & 1
-        horiflip = (tile_num >> 5) & 1
-        vertflip = (tile_num >> 6) & 1
-        bg_priority = (tile_num >> 7) & 1
+        return _CGB_MAP_ATTRIBUTES[lcd.VRAM1[i]]
 
-        return palette, vbank, horiflip, vertflip, bg_priority
+    def render_scanline(self, lcd, y):
+        # The background and window leave their per pixel attributes in `_line_attributes`, which the sprites on the
+        # same line read straight away. Nothing is kept for the rest of the frame.
+        if self.scanline(lcd, y):
+            self.scanline_sprites(lcd, y, self._screenbuffer_flat, self._line_attributes, False)
 
     def scanline(self, lcd, y):
+        # Returns False when the line in the screen buffer was left as it is
         bx, by = lcd.getviewport()
         wx, wy = lcd.getwindowpos()
+        lcdc = lcd._LCDC.value
         # TODO: Move to lcd class
         self._scanlineparameters[y][0] = bx
         self._scanlineparameters[y][1] = by
         self._scanlineparameters[y][2] = wx
         self._scanlineparameters[y][3] = wy
-        self._scanlineparameters[y][4] = lcd._LCDC.tiledata_select
+        self._scanlineparameters[y][4] = lcdc & 0b1_0000 # Tile data select
 
         if lcd.disable_renderer:
-            return
-
-        # All VRAM addresses are offset by 0x8000
-        # Following addresses are 0x9800 and 0x9C00
-        background_offset = 0x1800 if lcd._LCDC.backgroundmap_select == 0 else 0x1C00
-        wmap = 0x1800 if lcd._LCDC.windowmap_select == 0 else 0x1C00
-
-        # Used for the half tile at the left side when scrolling
-        offset = bx & 0b111
+            return False
 
         # Weird behavior, where the window has it's own internal line counter. It's only incremented whenever the
         # window is drawing something on the screen.
-        if lcd._LCDC.window_enable and wy <= y and wx < COLS:
+        if lcdc & 0b10_0000 and wy <= y and wx < COLS: # Window enable
             self.ly_window += 1
 
-        for x in range(COLS):
-            if lcd._LCDC.window_enable and wy <= y and wx <= x:
-                tile_addr = wmap + (self.ly_window) // 8 * 32 % 0x400 + (x-wx) // 8 % 32
-                wt = lcd.VRAM0[tile_addr]
-                # If using signed tile indices, modify index
-                if not lcd._LCDC.tiledata_select:
-                    # (x ^ 0x80 - 128) to convert to signed, then
-                    # add 256 for offset (reduces to + 128)
-                    wt = (wt ^ 0x80) + 128
-
-                bg_priority_apply = 0
-                if self.cgb:
-                    palette, vbank, horiflip, vertflip, bg_priority = self._cgb_get_background_map_attributes(
-                        lcd, tile_addr
-                    )
-                    if vbank:
-                        self.update_tilecache1(lcd, wt, vbank)
-                        tilecache = self._tilecache1
-                    else:
-                        self.update_tilecache0(lcd, wt, vbank)
-                        tilecache = self._tilecache0
-
-                    xx = (7 - ((x-wx) % 8)) if horiflip else ((x-wx) % 8)
-                    yy = (8*wt + (7 - (self.ly_window) % 8)) if vertflip else (8*wt + (self.ly_window) % 8)
-
-                    pixel = lcd.bcpd.getcolor(palette, tilecache[yy, xx])
-                    col0 = (tilecache[yy, xx] == 0) & 1
-                    if bg_priority:
-                        # We hide extra rendering information in the lower 8 bits (A) of the 32-bit RGBA format
-                        bg_priority_apply = BG_PRIORITY_FLAG
-                else:
-                    self.update_tilecache0(lcd, wt, 0)
-                    xx = (x-wx) % 8
-                    yy = 8*wt + (self.ly_window) % 8
-                    pixel = lcd.BGP.getcolor(self._tilecache0[yy, xx])
-                    col0 = (self._tilecache0[yy, xx] == 0) & 1
-
-                self._screenbuffer[y, x] = pixel
-                # COL0_FLAG is 1
-                self._screenbuffer_attributes[y, x] = bg_priority_apply | col0
-                # self._screenbuffer_attributes[y, x] = bg_priority_apply
-                # if col0:
-                #     self._screenbuffer_attributes[y, x] = self._screenbuffer_attributes[y, x] | col0
-            # background_enable doesn't exist for CGB. It works as master priority instead
-            elif (not self.cgb and lcd._LCDC.background_enable) or self.cgb:
-                tile_addr = background_offset + (y+by) // 8 * 32 % 0x400 + (x+bx) // 8 % 32
-                bt = lcd.VRAM0[tile_addr]
-                # If using signed tile indices, modify index
-                if not lcd._LCDC.tiledata_select:
-                    # (x ^ 0x80 - 128) to convert to signed, then
-                    # add 256 for offset (reduces to + 128)
-                    bt = (bt ^ 0x80) + 128
-
-                bg_priority_apply = 0
-                if self.cgb:
-                    palette, vbank, horiflip, vertflip, bg_priority = self._cgb_get_background_map_attributes(
-                        lcd, tile_addr
-                    )
-
-                    if vbank:
-                        self.update_tilecache1(lcd, bt, vbank)
-                        tilecache = self._tilecache1
-                    else:
-                        self.update_tilecache0(lcd, bt, vbank)
-                        tilecache = self._tilecache0
-                    xx = (7 - ((x+offset) % 8)) if horiflip else ((x+offset) % 8)
-                    yy = (8*bt + (7 - (y+by) % 8)) if vertflip else (8*bt + (y+by) % 8)
-
-                    pixel = lcd.bcpd.getcolor(palette, tilecache[yy, xx])
-                    col0 = (tilecache[yy, xx] == 0) & 1
-                    if bg_priority:
-                        # We hide extra rendering information in the lower 8 bits (A) of the 32-bit RGBA format
-                        bg_priority_apply = BG_PRIORITY_FLAG
-                else:
-                    self.update_tilecache0(lcd, bt, 0)
-                    xx = (x+offset) % 8
-                    yy = 8*bt + (y+by) % 8
-                    pixel = lcd.BGP.getcolor(self._tilecache0[yy, xx])
-                    col0 = (self._tilecache0[yy, xx] == 0) & 1
-
-                self._screenbuffer[y, x] = pixel
-                self._screenbuffer_attributes[y, x] = bg_priority_apply | col0
-            else:
-                # If background is disabled, it becomes white
-                self._screenbuffer[y, x] = lcd.BGP.getcolor(0)
-                self._screenbuffer_attributes[y, x] = 0
+        if not self.cgb:
+            if y == 0:
+                self.update_dirty_tiles(lcd)
+            # The line, sprites included, comes out the same as in the last frame when none of its inputs changed.
+            # Everything else it reads from is covered by the generation.
+            inputs = (bx, by, wx, wy, self.ly_window, lcdc, self._vram_generation)
+            drawn = self._scanline_inputs[y] != inputs
+            if drawn:
+                self._scanline_inputs[y] = inputs
+                scanline_dmg(
+                    lcd.VRAM0, lcd.BGP.lut, self._tilecache0_flat, self._tilergba0, self._tilecache0_state,
+                    self._screenbuffer_flat, self._line_attributes, y, bx, by, wx, wy, self.ly_window, lcdc
+                )
+        else:
+            self.scanline_cgb(lcd, y, bx, by, wx, wy)
+            drawn = True
 
         if y == 143:
             # Reset at the end of a frame. We set it to -1, so it will be 0 after the first increment
             self.ly_window = -1
+        return drawn
 
-    def sort_sprites(self, sprite_count):
-        # Use insertion sort, as it has O(n) on already sorted arrays. This
-        # functions is likely called multiple times with unchanged data.
-        # Sort descending because of the sprite priority.
-
-        for i in range(1, sprite_count):
-            key = self.sprites_to_render[i] # The current element to be inserted into the sorted portion
-            j = i - 1 # Index of the last element in the sorted portion of the array
+    def update_dirty_tiles(self, lcd):
+        # Decodes every tile that has been invalidated since the last frame, in one go at the start of the frame.
+        # Tiles written to during the frame are still decoded one at a time by the scanline kernel.
+        if not self.dirty_tiles:
+            return
+        dirty = np.fromiter(self.dirty_tiles, dtype=np.intp, count=len(self.dirty_tiles))
+        self.dirty_tiles.clear()
+        vram = np.frombuffer(lcd.VRAM0, dtype=np.uint8, count=TILES * 16).reshape(TILES, 8, 2)
+        colorcodes = _decode_tiles(vram, dirty)
+        self._tilecache0_np[dirty] = colorcodes
+        self._tilergba0_np[dirty] = np.frombuffer(lcd.BGP.lut, dtype=np.uint32)[colorcodes]
+        self._tilecache0_state_np[dirty] = 1
+
+    def scanline_cgb(self, lcd, y, bx, by, wx, wy):
+        # All VRAM addresses are offset by 0x8000
+        # Following addresses are 0x9800 and 0x9C00
+        lcdc = lcd._LCDC.value
+        background_offset = 0x1C00 if lcdc & 0b1000 else 0x1800
+        wmap = 0x1C00 if lcdc & 0b100_0000 else 0x1800
 
-            # Move elements of the sorted portion greater than the key to the right
-            while j >= 0 and key > self.sprites_to_render[j]:
-                self.sprites_to_render[j + 1] = self.sprites_to_render[j]
-                j -= 1
+        # The window covers the rest of the line from wx
+        if lcdc & 0b10_0000 and wy <= y:
+            window_start = min(max(wx, 0), COLS)
+        else:
+            window_start = COLS
+        row = y * COLS
+        draw_tile_line = self.draw_cgb_tile_line
+
+        # As in `scanline_dmg`, the line is drawn a tile at a time, and `tx` is where the tile starts on the screen.
+        # background_enable doesn't exist for CGB. It works as master priority instead
+        tilerow = background_offset + (y+by) // 8 * 32 % 0x400
+        line = (y+by) % 8
+        # Used for the half tile at the left side when scrolling
+        offset = bx & 0b111
+        tile_column = bx // 8
+        for tx in range(-offset, window_start, 8):
+            draw_tile_line(lcd, tilerow + tile_column, line, row, tx, max(-tx, 0), min(window_start - tx, 8))
+            tile_column = (tile_column+1) & 31
+
+        if window_start < COLS:
+            tilerow = wmap + self.ly_window // 8 * 32 % 0x400
+            line = self.ly_window % 8
+            tile_column = 0
+            for tx in range(wx, COLS, 8):
+                draw_tile_line(lcd, tilerow + tile_column, line, row, tx, max(-tx, 0), min(COLS - tx, 8))
+                tile_column = (tile_column+1) & 31
+
+    def draw_cgb_tile_line(self, lcd, tile_addr, line, row, tx, first, last):
+        # Draws pixels `first` to `last` of the given line of the tile at `tile_addr` in the tile map
+        t = lcd.VRAM0[tile_addr]
+        # If using signed tile indices, modify index
+        if not lcd._LCDC.value & 0b1_0000:
+            t = SIGNED_TILE_INDEX[t]
+
+        palette, vbank, horiflip, vertflip, bg_priority = _CGB_MAP_ATTRIBUTES[lcd.VRAM1[tile_addr]]
+        if vbank:
+            self.update_tilecache1(lcd, t, vbank)
+            tilecache = self._tilecache1_flat
+        else:
+            self.update_tilecache0(lcd, t, vbank)
+            tilecache = self._tilecache0_flat
+        j = (8*t + (7 - line if vertflip else line)) * 8
+
+        # The CGB palettes are already stored as one flat table of 8 palettes with 4 colors each
+        bcpd_lut = lcd.bcpd.palette_mem_rgb
+        palette *= 4
+        bg_priority_apply = BG_PRIORITY_FLAG if bg_priority else 0
+        screenbuffer = self._screenbuffer_flat
+        line_attributes = self._line_attributes
+        for xx in range(first, last):
+            colorcode = tilecache[j + (7 - xx if horiflip else xx)]
+            screenbuffer[row + tx + xx] = bcpd_lut[palette + colorcode]
+            # COL0_FLAG is 1
+            line_attributes[tx + xx] = bg_priority_apply | (colorcode == 0)
 
-            # Insert the key into its correct position in the sorted portion
-            self.sprites_to_render[j + 1] = key
+    def sort_sprites(self, sprite_count):
+        # Sort descending because of the sprite priority. There are at most 10 sprites, so the built-in sort is quicker
+        # than any sort written in Python.
+        sprites = self.sprites_to_render
+        if self.cgb:
+            # The sprites are found in OAM order, which is already ascending. Only reverse them.
+            sprites[:sprite_count] = sprites[:sprite_count][::-1]
+        else:
+            sprites[:sprite_count] = array.array("i", sorted(sprites[:sprite_count], reverse=True))
 
     def scanline_sprites(self, lcd, ly, buffer, buffer_attributes, ignore_priority):
-        if not lcd._LCDC.sprite_enable or lcd.disable_renderer:
+        # `buffer` is a flat (ROWS * COLS) buffer of the screen, and `buffer_attributes` holds the attributes of the
+        # background and window for line `ly` only.
+        lcdc = lcd._LCDC.value
+        if not lcdc & 0b10 or lcd.disable_renderer: # Sprite enable
             return
 
+        cgb = self.cgb
+        OAM = lcd.OAM
+        sprites_to_render = self.sprites_to_render
+
         # Find the first 10 sprites in OAM that appears on this scanline.
         # The lowest X-coordinate has priority, when overlapping
-        spriteheight = 16 if lcd._LCDC.sprite_height else 8
+        spriteheight = 16 if lcdc & 0b100 else 8
         sprite_count = 0
         for n in range(0x00, 0xA0, 4):
-            y = lcd.OAM[n] - 16 # Documentation states the y coordinate needs to be subtracted by 16
-            x = lcd.OAM[n + 1] - 8 # Documentation states the x coordinate needs to be subtracted by 8
+            y = OAM[n] - 16 # Documentation states the y coordinate needs to be subtracted by 16
+            x = OAM[n + 1] - 8 # Documentation states the x coordinate needs to be subtracted by 8
 
             if y <= ly < y + spriteheight:
                 # x is used for sorting for priority
-                if self.cgb:
-                    self.sprites_to_render[sprite_count] = n
+                if cgb:
+                    sprites_to_render[sprite_count] = n
                 else:
-                    self.sprites_to_render[sprite_count] = x << 16 | n
+                    sprites_to_render[sprite_count] = x << 16 | n
                 sprite_count += 1
 
             if sprite_count == 10:
@@ -412,31 +455,44 @@ class Renderer:
         # the same priority as in CGB mode.
         self.sort_sprites(sprite_count)
 
-        for _n in self.sprites_to_render[:sprite_count]:
-            if self.cgb:
+        if cgb:
+            ocpd_lut = lcd.ocpd.palette_mem_rgb
+            cgb_master_priority = lcdc & 0b1
+        else:
+            OBP0_lut = lcd.OBP0.lut
+            OBP1_lut = lcd.OBP1.lut
+
+        row = ly * COLS
+        for _n in sprites_to_render[:sprite_count]:
+            if cgb:
                 n = _n
             else:
                 n = _n & 0xFF
             # n = self.sprites_to_render_n[_n]
-            y = lcd.OAM[n] - 16 # Documentation states the y coordinate needs to be subtracted by 16
-            x = lcd.OAM[n + 1] - 8 # Documentation states the x coordinate needs to be subtracted by 8
-            tileindex = lcd.OAM[n + 2]
+            y = OAM[n] - 16 # Documentation states the y coordinate needs to be subtracted by 16
+            sprite_x = OAM[n + 1] - 8 # Documentation states the x coordinate needs to be subtracted by 8
+            # Clip the sprite to the screen up front. Skip it, if it's entirely outside.
+            dx_start = max(-sprite_x, 0)
+            dx_end = min(COLS - sprite_x, 8)
+            if dx_end <= dx_start:
+                continue
+            tileindex = OAM[n + 2]
             if spriteheight == 16:
                 tileindex &= 0b11111110
-            attributes = lcd.OAM[n + 3]
+            attributes = OAM[n + 3]
             xflip = attributes & 0b00100000
             yflip = attributes & 0b01000000
             spritepriority = (attributes & 0b10000000) and not ignore_priority
-            if self.cgb:
+            if cgb:
                 palette = attributes & 0b111
                 if attributes & 0b1000:
                     self.update_spritecache1(lcd, tileindex, 1)
-                    if lcd._LCDC.sprite_height:
+                    if spriteheight == 16:
                         self.update_spritecache1(lcd, tileindex + 1, 1)
                     spritecache = self._spritecache1
                 else:
                     self.update_spritecache0(lcd, tileindex, 0)
-                    if lcd._LCDC.sprite_height:
+                    if spriteheight == 16:
                         self.update_spritecache0(lcd, tileindex + 1, 0)
                     spritecache = self._spritecache0
             else:
@@ -444,58 +500,61 @@ class Renderer:
                 palette = 0
                 if attributes & 0b10000:
                     self.update_spritecache1(lcd, tileindex, 0)
-                    if lcd._LCDC.sprite_height:
+                    if spriteheight == 16:
                         self.update_spritecache1(lcd, tileindex + 1, 0)
                     spritecache = self._spritecache1
                 else:
                     self.update_spritecache0(lcd, tileindex, 0)
-                    if lcd._LCDC.sprite_height:
+                    if spriteheight == 16:
                         self.update_spritecache0(lcd, tileindex + 1, 0)
                     spritecache = self._spritecache0
 
             dy = ly - y
             yy = spriteheight - dy - 1 if yflip else dy
 
-            for dx in range(8):
+            for dx in range(dx_start, dx_end):
                 xx = 7 - dx if xflip else dx
                 color_code = spritecache[8*tileindex + yy, xx]
-                if 0 <= x < COLS and not color_code == 0: # If pixel is not transparent
-                    if self.cgb:
-                        pixel = lcd.ocpd.getcolor(palette, color_code)
-                        bgmappriority = buffer_attributes[ly, x] & BG_PRIORITY_FLAG
+                if color_code: # If pixel is not transparent
+                    x = sprite_x + dx
+                    if cgb:
+                        pixel = ocpd_lut[palette*4 + color_code]
+                        bgmappriority = buffer_attributes[x] & BG_PRIORITY_FLAG
 
-                        if lcd._LCDC.cgb_master_priority: # If 0, sprites are always on top, if 1 follow priorities
+                        if cgb_master_priority: # If 0, sprites are always on top, if 1 follow priorities
                             if bgmappriority: # If 0, use spritepriority, if 1 take priority
-                                if buffer_attributes[ly, x] & COL0_FLAG:
-                                    buffer[ly, x] = pixel
+                                if buffer_attributes[x] & COL0_FLAG:
+                                    buffer[row + x] = pixel
                             elif spritepriority: # If 1, sprite is behind bg/window. Color 0 of window/bg is transparent
-                                if buffer_attributes[ly, x] & COL0_FLAG:
-                                    buffer[ly, x] = pixel
+                                if buffer_attributes[x] & COL0_FLAG:
+                                    buffer[row + x] = pixel
                             else:
-                                buffer[ly, x] = pixel
+                                buffer[row + x] = pixel
                         else:
-                            buffer[ly, x] = pixel
+                            buffer[row + x] = pixel
                     else:
                         # TODO: Unify with CGB
                         if attributes & 0b10000:
-                            pixel = lcd.OBP1.getcolor(color_code)
+                            pixel = OBP1_lut[color_code]
                         else:
-                            pixel = lcd.OBP0.getcolor(color_code)
+                            pixel = OBP0_lut[color_code]
 
                         if spritepriority: # If 1, sprite is behind bg/window. Color 0 of window/bg is transparent
-                            if buffer_attributes[ly, x] & COL0_FLAG: # if BG pixel is transparent
-                                buffer[ly, x] = pixel
+                            if buffer_attributes[x] & COL0_FLAG: # if BG pixel is transparent
+                                buffer[row + x] = pixel
                         else:
-                            buffer[ly, x] = pixel
-                x += 1
-            x -= 8
+                            buffer[row + x] = pixel
 
     def clear_cache(self):
         self.clear_tilecache0()
         self.clear_spritecache0()
         self.clear_spritecache1()
 
+    def invalidate_scanlines(self):
+        self._vram_generation += 1
+
     def invalidate_tile(self, tile, vbank):
+        self._vram_generation += 1
         if vbank and self.cgb:
             self._tilecache0_state[tile] = 0
             self._tilecache1_state[tile] = 0
@@ -503,6 +562,7 @@ class Renderer:
             self._spritecache1_state[tile] = 0
         else:
             self._tilecache0_state[tile] = 0
+            self.dirty_tiles.add(tile)
             if self.cgb:
                 self._tilecache1_state[tile] = 0
             self._spritecache0_state[tile] = 0
@@ -511,6 +571,8 @@ class Renderer:
     def clear_tilecache0(self):
         for i in range(TILES):
             self._tilecache0_state[i] = 0
+        self.dirty_tiles.update(range(TILES))
+        self._vram_generation += 1
 
     def clear_tilecache1(self):
         pass
@@ -518,10 +580,12 @@ class Renderer:
     def clear_spritecache0(self):
         for i in range(TILES):
             self._spritecache0_state[i] = 0
+        self._vram_generation += 1
 
     def clear_spritecache1(self):
         for i in range(TILES):
             self._spritecache1_state[i] = 0
+        self._vram_generation += 1
 
     def color_code(self, byte1, byte2, offset):
         """Convert 2 bytes into color code at a given offset.
@@ -537,59 +601,24 @@ class Renderer:
         return (((byte2 >> (offset)) & 0b1) << 1) + ((byte1 >> (offset)) & 0b1)
 
     def update_tilecache0(self, lcd, t, bank):
-        if self._tilecache0_state[t]:
-            return
-        # for t in self.tiles_changed0:
-        for k in range(0, 16, 2): # 2 bytes for each line
-            byte1 = lcd.VRAM0[t*16 + k]
-            byte2 = lcd.VRAM0[t*16 + k + 1]
-            y = (t*16 + k) // 2
-
-            for x in range(8):
-                colorcode = self.color_code(byte1, byte2, 7 - x)
-                self._tilecache0[y, x] = colorcode
-
-        self._tilecache0_state[t] = 1
+        if not self._tilecache0_state[t]:
+            update_tile(lcd.VRAM0, lcd.BGP.lut, self._tilecache0_flat, self._tilergba0, self._tilecache0_state, t)
 
     def update_tilecache1(self, lcd, t, bank):
         pass
 
     def update_spritecache0(self, lcd, t, bank):
-        if self._spritecache0_state[t]:
-            return
-        # for t in self.tiles_changed0:
-        for k in range(0, 16, 2): # 2 bytes for each line
-            byte1 = lcd.VRAM0[t*16 + k]
-            byte2 = lcd.VRAM0[t*16 + k + 1]
-            y = (t*16 + k) // 2
-
-            for x in range(8):
-                colorcode = self.color_code(byte1, byte2, 7 - x)
-                self._spritecache0[y, x] = colorcode
-
-        self._spritecache0_state[t] = 1
+        if not self._spritecache0_state[t]:
+            decode_tile(lcd.VRAM0, self._spritecache0_flat, self._spritecache0_state, t)
 
     def update_spritecache1(self, lcd, t, bank):
-        if self._spritecache1_state[t]:
-            return
-        # for t in self.tiles_changed0:
-        for k in range(0, 16, 2): # 2 bytes for each line
-            byte1 = lcd.VRAM0[t*16 + k]
-            byte2 = lcd.VRAM0[t*16 + k + 1]
-            y = (t*16 + k) // 2
-
-            for x in range(8):
-                colorcode = self.color_code(byte1, byte2, 7 - x)
-                self._spritecache1[y, x] = colorcode
-
-        self._spritecache1_state[t] = 1
+        if not self._spritecache1_state[t]:
+            decode_tile(lcd.VRAM0, self._spritecache1_flat, self._spritecache1_state, t)
 
     def blank_screen(self, lcd):
         # If the screen is off, fill it with a color.
-        for y in range(ROWS):
-            for x in range(COLS):
-                self._screenbuffer[y, x] = lcd.BGP.getcolor(0)
-                self._screenbuffer_attributes[y, x] = 0
+        self._screenbuffer_np.fill(lcd.BGP.lut[0])
+        self._vram_generation += 1
 
 
 ####################################
@@ -605,7 +634,7 @@ class Renderer:
 class CGBLCD(LCD):
     def __init__(self, cgb, cartridge_cgb, color_palette, cgb_color_palette, randomize=False):
         LCD.__init__(self, cgb, cartridge_cgb, color_palette, cgb_color_palette, randomize=False)
-        self.VRAM1 = array.array("B", [0] * VIDEO_RAM)
+        self.VRAM1 = array.array("B", bytes(VIDEO_RAM))
 
         self.vbk = VBKregister()
         self.bcps = PaletteIndexRegister()
@@ -616,13 +645,14 @@ class CGBLCD(LCD):
 
 class CGBRenderer(Renderer):
     def __init__(self):
-        self._tilecache1_state = array.array("B", [0] * TILES)
+        self._tilecache1_state = array.array("B", bytes(TILES))
         Renderer.__init__(self, True)
 
-        self._tilecache1_raw = array.array("B", [0xFF] * (TILES*8*8*4))
+        self._tilecache1_raw = array.array("B", b"\xFF" * (TILES*8*8*4))
 
         self._tilecache1 = memoryview(self._tilecache1_raw).cast("I", shape=(TILES * 8, 8))
-        self._tilecache1_state = array.array("B", [0] * TILES)
+        self._tilecache1_flat = memoryview(self._tilecache1_raw).cast("I")
+        self._tilecache1_state = array.array("B", bytes(TILES))
         self.clear_cache()
 
     def clear_cache(self):
@@ -636,76 +666,17 @@ class CGBRenderer(Renderer):
             self._tilecache1_state[i] = 0
 
     def update_tilecache0(self, lcd, t, bank):
-        if self._tilecache0_state[t]:
-            return
-
-        if bank:
-            vram_bank = lcd.VRAM1
-        else:
-            vram_bank = lcd.VRAM0
-
-        # for t in self.tiles_changed0:
-        for k in range(0, 16, 2): # 2 bytes for each line
-            byte1 = vram_bank[t*16 + k]
-            byte2 = vram_bank[t*16 + k + 1]
-            y = (t*16 + k) // 2
-
-            for x in range(8):
-                self._tilecache0[y, x] = self.color_code(byte1, byte2, 7 - x)
-
-        self._tilecache0_state[t] = 1
+        if not self._tilecache0_state[t]:
+            decode_tile(lcd.VRAM1 if bank else lcd.VRAM0, self._tilecache0_flat, self._tilecache0_state, t)
 
     def update_tilecache1(self, lcd, t, bank):
-        if self._tilecache1_state[t]:
-            return
-        if bank:
-            vram_bank = lcd.VRAM1
-        else:
-            vram_bank = lcd.VRAM0
-        # for t in self.tiles_changed0:
-        for k in range(0, 16, 2): # 2 bytes for each line
-            byte1 = vram_bank[t*16 + k]
-            byte2 = vram_bank[t*16 + k + 1]
-            y = (t*16 + k) // 2
-
-            for x in range(8):
-                self._tilecache1[y, x] = self.color_code(byte1, byte2, 7 - x)
-
-        self._tilecache1_state[t] = 1
+        if not self._tilecache1_state[t]:
+            decode_tile(lcd.VRAM1 if bank else lcd.VRAM0, self._tilecache1_flat, self._tilecache1_state, t)
 
     def update_spritecache0(self, lcd, t, bank):
-        if self._spritecache0_state[t]:
-            return
-        if bank:
-            vram_bank = lcd.VRAM1
-        else:
-            vram_bank = lcd.VRAM0
-        # for t in self.tiles_changed0:
-        for k in range(0, 16, 2): # 2 bytes for each line
-            byte1 = vram_bank[t*16 + k]
-            byte2 = vram_bank[t*16 + k + 1]
-            y = (t*16 + k) // 2
-
-            for x in range(8):
-                self._spritecache0[y, x] = self.color_code(byte1, byte2, 7 - x)
-
-        self._spritecache0_state[t] = 1
+        if not self._spritecache0_state[t]:
+            decode_tile(lcd.VRAM1 if bank else lcd.VRAM0, self._spritecache0_flat, self._spritecache0_state, t)
 
     def update_spritecache1(self, lcd, t, bank):
-        if self._spritecache1_state[t]:
-            return
-        if bank:
-            vram_bank = lcd.VRAM1
-        else:
-            vram_bank = lcd.VRAM0
-        # for t in self.tiles_changed0:
-        for k in range(0, 16, 2): # 2 bytes for each line
-            byte1 = vram_bank[t*16 + k]
-            byte2 = vram_bank[t*16 + k + 1]
-            y = (t*16 + k) // 2
-
-            for x in range(8):
-                self._spritecache1[y, x] = self.color_code(byte1, byte2, 7 - x)
-
-        self._spritecache1_state[t] = 1
-
+        if not self._spritecache1_state[t]:
+            decode_tile(lcd.VRAM1 if bank else lcd.VRAM0, self._spritecache1_flat, self._spritecache1_state, t)
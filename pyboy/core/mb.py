@@ -241,21 +241,21 @@ class Motherboard:
 	# MemoryManager
 	#
 	def getitem(self, i):
-		if 0x0000 <= i < 0x4000: # 16kB ROM bank #0
+		if i < 0x4000: # 16kB ROM bank #0
 			if self.bootrom_enabled and (i <= 0xFF or (self.cgb and 0x200 <= i < 0x900)):
 				return self.bootrom.getitem(i)
 			else:
 				return self.cartridge.getitem(i)
-		elif 0x4000 <= i < 0x8000: # 16kB switchable ROM bank
+		elif i < 0x8000: # 16kB switchable ROM bank
 			return self.cartridge.getitem(i)
-		elif 0x8000 <= i < 0xA000: # 8kB Video RAM
+		elif i < 0xA000: # 8kB Video RAM
 			if not self.cgb or self.lcd.vbk.active_bank == 0:
 				return self.lcd.VRAM0[i - 0x8000]
 			else:
 				return self.lcd.VRAM1[i - 0x8000]
-		elif 0xA000 <= i < 0xC000: # 8kB switchable RAM bank
+		elif i < 0xC000: # 8kB switchable RAM bank
 			return self.cartridge.getitem(i)
-		elif 0xC000 <= i < 0xE000: # 8kB Internal RAM
+		elif i < 0xE000: # 8kB Internal RAM
 			bank_offset = 0
 			if self.cgb and 0xD000 <= i:
 				# Find which bank to read from at FF70
@@ -265,14 +265,14 @@ class Motherboard:
 					bank = 0x01
 				bank_offset = (bank-1) * 0x1000
 			return self.ram.internal_ram0[i - 0xC000 + bank_offset]
-		elif 0xE000 <= i < 0xFE00: # Echo of 8kB Internal RAM
+		elif i < 0xFE00: # Echo of 8kB Internal RAM
 			# Redirect to internal RAM
 			return self.getitem(i - 0x2000)
-		elif 0xFE00 <= i < 0xFEA0: # Sprite Attribute Memory (OAM)
+		elif i < 0xFEA0: # Sprite Attribute Memory (OAM)
 			return self.lcd.OAM[i - 0xFE00]
-		elif 0xFEA0 <= i < 0xFF00: # Empty but unusable for I/O
+		elif i < 0xFF00: # Empty but unusable for I/O
 			return self.ram.non_io_internal_ram0[i - 0xFEA0]
-		elif 0xFF00 <= i < 0xFF4C: # I/O ports
+		elif i < 0xFF4C: # I/O ports
 			if i == 0xFF04:
 				return self.timer.DIV
 			elif i == 0xFF05:
@@ -311,7 +311,7 @@ class Motherboard:
 				return self.lcd.WX
 			else:
 				return self.ram.io_ports[i - 0xFF00]
-		elif 0xFF4C <= i < 0xFF80: # Empty but unusable for I/O
+		elif i < 0xFF80: # Empty but unusable for I/O
 			# CGB registers
 			if self.cgb and i == 0xFF4D:
 				return self.key1
@@ -340,34 +340,47 @@ class Motherboard:
 			elif self.cgb and i == 0xFF55:
 				return self.hdma.hdma5 & 0xFF
 			return self.ram.non_io_internal_ram1[i - 0xFF4C]
-		elif 0xFF80 <= i < 0xFFFF: # Internal RAM
+		elif i < 0xFFFF: # Internal RAM
 			return self.ram.internal_ram1[i - 0xFF80]
 		elif i == 0xFFFF: # Interrupt Enable Register
 			return self.cpu.interrupts_enabled_register
 		# else:
 		#	logger.critical("Memory access violation. Tried to read: %0.4x", i)
 
+	def getword(self, i):
+		# Little-endian 16-bit read. A word within one 256-byte page of the cartridge is read with a single lookup.
+		if i < 0x8000 and (i & 0xFF) != 0xFF and not self.bootrom_enabled:
+			return self.cartridge.getword(i)
+		return self.getitem(i) | (self.getitem((i+1) & 0xFFFF) << 8)
+
 	def setitem(self, i, value):
-		if 0x0000 <= i < 0x4000: # 16kB ROM bank #0
+		if i < 0x4000: # 16kB ROM bank #0
 			# Doesn't change the data. This is for MBC commands
 			self.cartridge.setitem(i, value)
-		elif 0x4000 <= i < 0x8000: # 16kB switchable ROM bank
+		elif i < 0x8000: # 16kB switchable ROM bank
 			# Doesn't change the data. This is for MBC commands
 			self.cartridge.setitem(i, value)
-		elif 0x8000 <= i < 0xA000: # 8kB Video RAM
+		elif i < 0xA000: # 8kB Video RAM
+			# Writing the value already there doesn't change any tile, so the decoded tiles are kept
 			if not self.cgb or self.lcd.vbk.active_bank == 0:
-				self.lcd.VRAM0[i - 0x8000] = value
-				if i < 0x9800: # Is within tile data -- not tile maps
-					# Mask out the byte of the tile
-					self.lcd.renderer.invalidate_tile(((i & 0xFFF0) - 0x8000) // 16, 0)
+				if self.lcd.VRAM0[i - 0x8000] != value:
+					self.lcd.VRAM0[i - 0x8000] = value
+					if i < 0x9800: # Is within tile data -- not tile maps
+						# Mask out the byte of the tile
+						self.lcd.renderer.invalidate_tile(((i & 0xFFF0) - 0x8000) // 16, 0)
+					else:
+						self.lcd.renderer.invalidate_scanlines()
 			else:
-				self.lcd.VRAM1[i - 0x8000] = value
-				if i < 0x9800: # Is within tile data -- not tile maps
-					# Mask out the byte of the tile
-					self.lcd.renderer.invalidate_tile(((i & 0xFFF0) - 0x8000) // 16, 1)
-		elif 0xA000 <= i < 0xC000: # 8kB switchable RAM bank
+				if self.lcd.VRAM1[i - 0x8000] != value:
+					self.lcd.VRAM1[i - 0x8000] = value
+					if i < 0x9800: # Is within tile data -- not tile maps
+						# Mask out the byte of the tile
+						self.lcd.renderer.invalidate_tile(((i & 0xFFF0) - 0x8000) // 16, 1)
+					else:
+						self.lcd.renderer.invalidate_scanlines()
+		elif i < 0xC000: # 8kB switchable RAM bank
 			self.cartridge.setitem(i, value)
-		elif 0xC000 <= i < 0xE000: # 8kB Internal RAM
+		elif i < 0xE000: # 8kB Internal RAM
 			bank_offset = 0
 			if self.cgb and 0xD000 <= i:
 				# Find which bank to read from at FF70
@@ -377,13 +390,15 @@ class Motherboard:
 					bank = 0x01
 				bank_offset = (bank-1) * 0x1000
 			self.ram.internal_ram0[i - 0xC000 + bank_offset] = value
-		elif 0xE000 <= i < 0xFE00: # Echo of 8kB Internal RAM
+		elif i < 0xFE00: # Echo of 8kB Internal RAM
 			self.setitem(i - 0x2000, value) # Redirect to internal RAM
-		elif 0xFE00 <= i < 0xFEA0: # Sprite Attribute Memory (OAM)
-			self.lcd.OAM[i - 0xFE00] = value
-		elif 0xFEA0 <= i < 0xFF00: # Empty but unusable for I/O
+		elif i < 0xFEA0: # Sprite Attribute Memory (OAM)
+			if self.lcd.OAM[i - 0xFE00] != value:
+				self.lcd.OAM[i - 0xFE00] = value
+				self.lcd.renderer.invalidate_scanlines()
+		elif i < 0xFF00: # Empty but unusable for I/O
 			self.ram.non_io_internal_ram0[i - 0xFEA0] = value
-		elif 0xFF00 <= i < 0xFF4C: # I/O ports
+		elif i < 0xFF4C: # I/O ports
 			if i == 0xFF00:
 				self.ram.io_ports[i - 0xFF00] = self.interaction.pull(value)
 			elif i == 0xFF01:
@@ -435,7 +450,7 @@ class Motherboard:
 				self.lcd.WX = value
 			else:
 				self.ram.io_ports[i - 0xFF00] = value
-		elif 0xFF4C <= i < 0xFF80: # Empty but unusable for I/O
+		elif i < 0xFF80: # Empty but unusable for I/O
 			if self.bootrom_enabled and i == 0xFF50 and (value == 0x1 or value == 0x11):
 				logger.debug("Bootrom disabled!")
 				self.bootrom_enabled = False
@@ -468,7 +483,7 @@ class Motherboard:
 				self.lcd.renderer.clear_spritecache1()
 			else:
 				self.ram.non_io_internal_ram1[i - 0xFF4C] = value
-		elif 0xFF80 <= i < 0xFFFF: # Internal RAM
+		elif i < 0xFFFF: # Internal RAM
 			self.ram.internal_ram1[i - 0xFF80] = value
 		elif i == 0xFFFF: # Interrupt Enable Register
 			self.cpu.interrupts_enabled_register = value
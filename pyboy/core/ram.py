@@ -14,19 +14,12 @@ INTERNAL_RAM1 = 0x7F
 class RAM:
 	def __init__(self, cgb, randomize=False):
 		self.cgb = cgb
-		self.internal_ram0 = array.array("B", [0] * (INTERNAL_RAM0_CGB if cgb else INTERNAL_RAM0))
-		self.non_io_internal_ram0 = array.array("B", [0] * (NON_IO_INTERNAL_RAM0))
-		self.io_ports = array.array("B", [0] * (IO_PORTS))
-		self.internal_ram1 = array.array("B", [0] * (INTERNAL_RAM1))
-		self.non_io_internal_ram1 = array.array("B", [0] * (NON_IO_INTERNAL_RAM1))
-		if randomize:
-			for n in range(INTERNAL_RAM0_CGB if cgb else INTERNAL_RAM0):
-				self.internal_ram0[n] = random.getrandbits(8)
-			for n in range(NON_IO_INTERNAL_RAM0):
-				self.non_io_internal_ram0[n] = random.getrandbits(8)
-			for n in range(INTERNAL_RAM1):
-				self.internal_ram1[n] = random.getrandbits(8)
-			for n in range(NON_IO_INTERNAL_RAM1):
-				self.non_io_internal_ram1[n] = random.getrandbits(8)
+		# Zeroed, or random when randomizing. randbytes still follows random.seed(), unlike os.urandom.
+		initial = random.randbytes if randomize else bytes
+		self.internal_ram0 = array.array("B", initial(INTERNAL_RAM0_CGB if cgb else INTERNAL_RAM0))
+		self.non_io_internal_ram0 = array.array("B", initial(NON_IO_INTERNAL_RAM0))
+		self.io_ports = array.array("B", bytes(IO_PORTS))
+		self.internal_ram1 = array.array("B", initial(INTERNAL_RAM1))
+		self.non_io_internal_ram1 = array.array("B", initial(NON_IO_INTERNAL_RAM1))
 
 
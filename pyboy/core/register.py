@@ -3,18 +3,28 @@
 import logging as logger
 import array
 
-from random import getrandbits
-from ctypes import c_void_p
-from copy import deepcopy
+import numpy as np
 
 INTR_VBLANK, INTR_LCDC, INTR_TIMER, INTR_SERIAL, INTR_HIGHTOLOW = [1 << x for x in range(5)]
 
 class PaletteRegister:
     def __init__(self, value):
         self.value = 0
-        self.lookup = [0] * 4
+        self.lookup = array.array("B", bytes(4))
+        # Final color for each color code. Rebuilt whenever the register or the colors change, so the renderer can
+        # index it directly.
+        self.lut = array.array("I", bytes(4 * 4))
+        self._palette_mem_rgb = [0] * 4
         self.set(value)
-        self.palette_mem_rgb = [0] * 4
+
+    @property
+    def palette_mem_rgb(self):
+        return self._palette_mem_rgb
+
+    @palette_mem_rgb.setter
+    def palette_mem_rgb(self, colors):
+        self._palette_mem_rgb = colors
+        self.update_lut()
 
     def set(self, value):
         # Pokemon Blue continuously sets this without changing the value
@@ -22,15 +32,27 @@ class PaletteRegister:
             return False
 
         self.value = value
-        for x in range(4):
-            self.lookup[x] = (value >> x * 2) & 0b11
+        # Color code 0 is in the lowest two bits, and color code 3 in the highest
+        lookup = self.lookup
+        lookup[0] = value & 0b11
+        lookup[1] = (value >> 2) & 0b11
+        lookup[2] = (value >> 4) & 0b11
+        lookup[3] = (value >> 6) & 0b11
+        self.update_lut()
         return True
 
+    def update_lut(self):
+        lut, lookup, colors = self.lut, self.lookup, self._palette_mem_rgb
+        lut[0] = colors[lookup[0]]
+        lut[1] = colors[lookup[1]]
+        lut[2] = colors[lookup[2]]
+        lut[3] = colors[lookup[3]]
+
     def get(self):
         return self.value
 
     def getcolor(self, i):
-        return self.palette_mem_rgb[self.lookup[i]]
+        return self.lut[i]
 
 class STATRegister:
     def __init__(self):
@@ -43,13 +65,11 @@ class STATRegister:
         self.value |= value # Combine the two
 
     def update_LYC(self, LYC, LY):
-        if LYC == LY:
-            self.value |= 0b100 # Sets the LYC flag
-            if self.value & 0b0100_0000: # LYC interrupt enabled flag
-                return INTR_LCDC
-        else:
-            # Clear LYC flag
-            self.value &= 0b1111_1011
+        # Sets or clears the LYC flag in one masked write
+        coincidence = LYC == LY
+        self.value = (self.value & 0b1111_1011) | (coincidence << 2)
+        if coincidence and self.value & 0b0100_0000: # LYC interrupt enabled flag
+            return INTR_LCDC
         return 0
 
     def set_mode(self, mode):
@@ -57,8 +77,7 @@ class STATRegister:
             # Mode already set
             return 0
         self._mode = mode
-        self.value &= 0b11111100 # Clearing 2 LSB
-        self.value |= mode # Apply mode to LSB
+        self.value = (self.value & 0b11111100) | mode # Apply mode to the 2 LSB
 
         # Check if interrupt is enabled for this mode
         # Mode "3" is not interruptable
@@ -73,18 +92,20 @@ class LCDCRegister:
 
     def set(self, value):
         self.value = value
-        # No need to convert to bool. Any non-zero value is true.
-        # yapf: disable
-        self.lcd_enable           = value & (1 << 7)
-        self.windowmap_select     = value & (1 << 6)
-        self.window_enable        = value & (1 << 5)
-        self.tiledata_select      = value & (1 << 4)
-        self.backgroundmap_select = value & (1 << 3)
-        self.sprite_height        = value & (1 << 2)
-        self.sprite_enable        = value & (1 << 1)
-        self.background_enable    = value & (1 << 0)
-        self.cgb_master_priority  = self.background_enable # Different meaning on CGB
-        # yapf: enable
+
+    # The flags are only masked out when read. The hot paths in the emulator mask `value` directly.
+    # No need to convert to bool. Any non-zero value is true.
+    # yapf: disable
+    lcd_enable           = property(lambda self: self.value & (1 << 7))
+    windowmap_select     = property(lambda self: self.value & (1 << 6))
+    window_enable        = property(lambda self: self.value & (1 << 5))
+    tiledata_select      = property(lambda self: self.value & (1 << 4))
+    backgroundmap_select = property(lambda self: self.value & (1 << 3))
+    sprite_height        = property(lambda self: self.value & (1 << 2))
+    sprite_enable        = property(lambda self: self.value & (1 << 1))
+    background_enable    = property(lambda self: self.value & (1 << 0))
+    cgb_master_priority  = background_enable # Different meaning on CGB
+    # yapf: enable
 
     def _get_sprite_height(self):
         return self.sprite_height
@@ -125,30 +146,48 @@ class PaletteIndexRegister:
 
     def shouldincrement(self):
         if self.auto_inc:
-            # ensure autoinc also set for new val
-            new_val = 0x80 | (self.value + 1)
-            self.set(new_val)
+            # Steps the byte address, which is the index and hl together. Bit 7 is kept, so auto-increment stays on,
+            # and only the index and hl need to be decoded again.
+            value = 0x80 | ((self.value + 1) & 0x7F)
+            self.value = value
+            self.hl = value & 0b1
+            self.index = (value >> 1) & 0b11111
 
     def save_state(self, f):
+        # The other fields are all decoded from the value
         f.write(self.value)
-        f.write(self.auto_inc)
-        f.write(self.index)
-        f.write(self.hl)
 
     def load_state(self, f, state_version):
-        self.value = f.read()
-        self.auto_inc = f.read()
-        self.index = f.read()
-        self.hl = f.read()
+        value = f.read()
+        if state_version < 11:
+            # auto_inc, index and hl were stored separately
+            f.read()
+            f.read()
+            f.read()
+        self.value = value
+        self.hl = value & 0b1
+        self.index = (value >> 1) & 0b11111
+        self.auto_inc = (value >> 7) & 0b1
 
 
 CGB_NUM_PALETTES = 8
 
+# RGB color for each of the 15-bit CGB colors. Each 5-bit channel is scaled up to 8 bits, and alpha is set.
+# NOTE: Actually BGR, not RGB
+_cgb_colors = np.arange(0x8000, dtype=np.uint32)
+_CGB_TO_RGB = array.array(
+    "I", (
+        0xFF000000 | ((_cgb_colors >> 10) & 0x1F) << 19 | ((_cgb_colors >> 5) & 0x1F) << 11 |
+        (_cgb_colors & 0x1F) << 3
+    ).tobytes()
+)
+del _cgb_colors
+
 class PaletteColorRegister:
     def __init__(self, i_reg):
         #8 palettes of 4 colors each 2 bytes
-        self.palette_mem = array.array("I", [0xFFFF] * CGB_NUM_PALETTES * 4)
-        self.palette_mem_rgb = array.array("L", [0] * CGB_NUM_PALETTES * 4)
+        self.palette_mem = array.array("H", [0xFFFF] * CGB_NUM_PALETTES * 4)
+        self.palette_mem_rgb = array.array("I", bytes(4 * CGB_NUM_PALETTES * 4))
         self.index_reg = i_reg
 
         # Init with some colors -- TODO: What are real defaults?
@@ -156,35 +195,29 @@ class PaletteColorRegister:
             c = [0x1CE7, 0x1E19, 0x7E31, 0x217B]
             for m in range(4):
                 self.palette_mem[n + m] = c[m]
-                self.palette_mem_rgb[n + m] = self.cgb_to_rgb(c[m], m)
+        self.update_palette_mem_rgb()
 
-    def cgb_to_rgb(self, cgb_color, index):
-        alpha = 0xFF
-        red = (cgb_color & 0x1F) << 3
-        green = ((cgb_color >> 5) & 0x1F) << 3
-        blue = ((cgb_color >> 10) & 0x1F) << 3
-        # NOTE: Actually BGR, not RGB
-        rgb_color = ((alpha << 24) | (blue << 16) | (green << 8) | red)
-        return rgb_color
+    def update_palette_mem_rgb(self):
+        # Converts all the colors in one go
+        cgb_color = np.frombuffer(self.palette_mem, dtype=np.uint16) & 0x7FFF
+        rgb = np.frombuffer(self.palette_mem_rgb, dtype=np.uint32)
+        rgb[:] = np.frombuffer(_CGB_TO_RGB, dtype=np.uint32)[cgb_color]
 
     def set(self, val):
-        i_val = self.palette_mem[self.index_reg.getindex()]
-        if self.index_reg.hl:
-            self.palette_mem[self.index_reg.getindex()] = (i_val & 0x00FF) | (val << 8)
-        else:
-            self.palette_mem[self.index_reg.getindex()] = (i_val & 0xFF00) | val
-
-        cgb_color = self.palette_mem[self.index_reg.getindex()] & 0x7FFF
-        self.palette_mem_rgb[self.index_reg.getindex()] = self.cgb_to_rgb(cgb_color, self.index_reg.getindex())
+        index_reg = self.index_reg
+        index = index_reg.index
+        # The high or low byte of the color is replaced, depending on `hl`
+        shift = index_reg.hl << 3
+        color = (self.palette_mem[index] & (0xFF00 >> shift)) | (val << shift)
+        self.palette_mem[index] = color
+        self.palette_mem_rgb[index] = _CGB_TO_RGB[color & 0x7FFF]
 
         #check for autoincrement after write
-        self.index_reg.shouldincrement()
+        index_reg.shouldincrement()
 
     def get(self):
-        if self.index_reg.hl:
-            return (self.palette_mem[self.index_reg.getindex()] & 0xFF00) >> 8
-        else:
-            return self.palette_mem[self.index_reg.getindex()] & 0x00FF
+        index_reg = self.index_reg
+        return (self.palette_mem[index_reg.index] >> (index_reg.hl << 3)) & 0xFF
 
     def getcolor(self, paletteindex, colorindex):
         # Each palette = 8 bytes or 4 colors of 2 bytes
@@ -200,4 +233,4 @@ class PaletteColorRegister:
     def load_state(self, f, state_version):
         for n in range(CGB_NUM_PALETTES * 4):
             self.palette_mem[n] = f.read_16bit()
-            self.palette_mem_rgb[n] = self.cgb_to_rgb(self.palette_mem[n], n % 4)
+        self.update_palette_mem_rgb()
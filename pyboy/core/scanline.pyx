@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*- 
+#
+# Cython build of the scanline kernels in `_scanline.py`. Keep the two in sync. The compiler directives are set for
+# all the compiled modules in setup.py.
+
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+
+cdef enum:
+    COLS = 160
+
+# Tile index for each byte in the tile map, when using signed tile indices. (x ^ 0x80 - 128) to convert to signed, then
+# add 256 for offset (reduces to + 128). The renderer imports the tuple. The kernels read the C array copied from it.
+SIGNED_TILE_INDEX = tuple((i ^ 0x80) + 128 for i in range(256))
+cdef uint16_t SIGNED_TILE_INDEX_C[256]
+for _i in range(256):
+    SIGNED_TILE_INDEX_C[_i] = SIGNED_TILE_INDEX[_i]
+
+
+cpdef void decode_tile(
+    const uint8_t[:] vram, uint32_t[:] tilecache, uint8_t[:] tilecache_state, int t
+) noexcept nogil:
+    # Decodes the color codes of tile `t`, unless it's already done. This is shared by all the tile and sprite caches.
+    cdef int k, x, y
+    cdef uint8_t byte1, byte2
+    if tilecache_state[t]:
+        return
+    for k in range(0, 16, 2): # 2 bytes for each line
+        byte1 = vram[t*16 + k]
+        byte2 = vram[t*16 + k + 1]
+        y = (t*16 + k) // 2
+
+        for x in range(8):
+            tilecache[y*8 + x] = (((byte2 >> (7-x)) & 0b1) << 1) + ((byte1 >> (7-x)) & 0b1)
+    tilecache_state[t] = 1
+
+
+cpdef void update_tile(
+    const uint8_t[:] vram, const uint32_t[:] palette, uint32_t[:] tilecache, uint32_t[:] tilergba,
+    uint8_t[:] tilecache_state, int t
+) noexcept nogil:
+    cdef int i
+    if tilecache_state[t]:
+        return
+    decode_tile(vram, tilecache, tilecache_state, t)
+    # The final color is kept as well, so drawing the line is only a copy
+    for i in range(t*64, t*64 + 64):
+        tilergba[i] = palette[tilecache[i]]
+
+
+cdef inline void draw_tile_line(
+    const uint32_t[:] tilecache, const uint32_t[:] tilergba, uint32_t[:] screenbuffer, uint8_t[:] attributes, int row,
+    int tx, int j, int first, int last
+) noexcept nogil:
+    # Copies pixel `first` up to `last` of the tile line at index `j` of the caches, to index `row + tx` of the screen.
+    # The attributes only cover the current line, so they are written from index `tx`.
+    cdef int xx
+    for xx in range(first, last):
+        screenbuffer[row + tx + xx] = tilergba[j + xx]
+        # COL0_FLAG is 1
+        attributes[tx + xx] = tilecache[j + xx] == 0
+
+
+cpdef void scanline_dmg(
+    const uint8_t[:] vram, const uint32_t[:] palette, uint32_t[:] tilecache, uint32_t[:] tilergba,
+    uint8_t[:] tilecache_state, uint32_t[:] screenbuffer, uint8_t[:] attributes, int y, int bx, int by, int wx, int wy,
+    int ly_window, int lcdc
+) noexcept nogil:
+    cdef int background_offset, wmap, tiledata_select, row, window_start, tilerow, line, offset, tile_column, tx, t, x
+    # All VRAM addresses are offset by 0x8000
+    # Following addresses are 0x9800 and 0x9C00
+    background_offset = 0x1C00 if lcdc & 0b1000 else 0x1800
+    wmap = 0x1C00 if lcdc & 0b100_0000 else 0x1800
+    tiledata_select = lcdc & 0b1_0000
+    row = y * COLS
+
+    # The window covers the rest of the line from wx
+    if lcdc & 0b10_0000 and wy <= y:
+        window_start = min(max(wx, 0), COLS)
+    else:
+        window_start = COLS
+
+    # The line is drawn a tile at a time. The tile is looked up once, and then up to 8 pixels are copied from it. `tx`
+    # is where the tile starts on the screen, which can be left of the screen for the first tile.
+    if lcdc & 0b1:
+        tilerow = background_offset + (y+by) // 8 * 32 % 0x400
+        line = (y+by) % 8
+        # Used for the half tile at the left side when scrolling
+        offset = bx & 0b111
+        # The map row wraps around after 32 tiles
+        tile_column = bx // 8
+        for tx in range(-offset, window_start, 8):
+            t = vram[tilerow + tile_column]
+            tile_column = (tile_column+1) & 31
+            # If using signed tile indices, modify index
+            if not tiledata_select:
+                t = SIGNED_TILE_INDEX_C[t]
+            update_tile(vram, palette, tilecache, tilergba, tilecache_state, t)
+            draw_tile_line(
+                tilecache, tilergba, screenbuffer, attributes, row, tx, (8*t + line) * 8, max(-tx, 0),
+                min(window_start - tx, 8)
+            )
+    else:
+        # If background is disabled, it becomes white
+        for x in range(window_start):
+            screenbuffer[row + x] = palette[0]
+            attributes[x] = 0
+
+    if window_start < COLS:
+        tilerow = wmap + ly_window // 8 * 32 % 0x400
+        line = ly_window % 8
+        tile_column = 0
+        for tx in range(wx, COLS, 8):
+            t = vram[tilerow + tile_column]
+            tile_column = (tile_column+1) & 31
+            if not tiledata_select:
+                t = SIGNED_TILE_INDEX_C[t]
+            update_tile(vram, palette, tilecache, tilergba, tilecache_state, t)
+            draw_tile_line(
+                tilecache, tilergba, screenbuffer, attributes, row, tx, (8*t + line) * 8, max(-tx, 0),
+                min(COLS - tx, 8)
+            )
@@ -245,7 +245,8 @@ class BaseDebugWindow(PyBoyWindowPlugin):
         self.window_id = sdl2.SDL_GetWindowID(self._window)
 
         self.buf0, self.buf_p = make_buffer(width, height)
-        self.buf0_attributes, _ = make_buffer(width, height, 1)
+        # Attributes of the background and window for one line, as used by `Renderer.scanline_sprites`
+        self.buf0_attributes = array("B", [0x55] * width)
 
         self._sdlrenderer = sdl2.SDL_CreateRenderer(self._window, -1, sdl2.SDL_RENDERER_ACCELERATED)
         sdl2.SDL_RenderSetLogicalSize(self._sdlrenderer, width, height)
@@ -617,8 +618,9 @@ class SpriteViewWindow(BaseDebugWindow):
             for x in range(constants.COLS):
                 self.buf0[y, x] = SPRITE_BACKGROUND
 
+        buf0_flat = self.buf0.cast("B").cast("I")
         for ly in range(144):
-            self.mb.lcd.renderer.scanline_sprites(self.mb.lcd, ly, self.buf0, self.buf0_attributes, True)
+            self.mb.lcd.renderer.scanline_sprites(self.mb.lcd, ly, buf0_flat, self.buf0_attributes, True)
 
         self.draw_overlay()
         BaseDebugWindow.post_tick(self)
@@ -18,50 +18,58 @@ def parser_arguments():
     pass
 
 
+# Bits in `PluginManager.enabled_mask`, one for each plugin
+WINDOW_SDL2 = 1 << 0
+
+
 class PluginManager:
     def __init__(self, pyboy, mb, pyboy_argv):
         self.pyboy = pyboy
         self.window_sdl2 = WindowSDL2(pyboy, mb, pyboy_argv)
-        self.window_sdl2_enabled = self.window_sdl2.enabled()
+        # The enabled plugins, looked up once. The methods called every frame return straight away if it's 0.
+        self.enabled_mask = WINDOW_SDL2 if self.window_sdl2.enabled() else 0
 
     def gamewrapper(self):
         pass
 
     def handle_events(self, events):
+        enabled_mask = self.enabled_mask
+        if not enabled_mask:
+            return events
         # foreach windows events = [].handle_events(events)
-        if self.window_sdl2_enabled:
+        if enabled_mask & WINDOW_SDL2:
             events = self.window_sdl2.handle_events(events)
         return events
 
     def post_tick(self):
-        self._post_tick_windows()
+        if self.enabled_mask:
+            self._post_tick_windows()
 
     def _set_title(self):
-        if self.window_sdl2_enabled:
+        if self.enabled_mask & WINDOW_SDL2:
             self.window_sdl2.set_title(self.pyboy.window_title)
-        pass
 
     def _post_tick_windows(self):
-        if self.window_sdl2_enabled:
+        if self.enabled_mask & WINDOW_SDL2:
             self.window_sdl2.post_tick()
-        pass
 
     def frame_limiter(self, speed):
-        if speed <= 0:
+        enabled_mask = self.enabled_mask
+        if speed <= 0 or not enabled_mask:
             return
         # foreach windows done = [].frame_limiter(speed), if done: return
-        if self.window_sdl2_enabled:
+        if enabled_mask & WINDOW_SDL2:
             done = self.window_sdl2.frame_limiter(speed)
             if done: return
 
     def window_title(self):
         title = ""
-        if self.window_sdl2_enabled:
+        if self.enabled_mask & WINDOW_SDL2:
             title += self.window_sdl2.window_title()
         return title
 
     def stop(self):
-        if self.window_sdl2_enabled:
+        if self.enabled_mask & WINDOW_SDL2:
             self.window_sdl2.stop()
 
     def handle_breakpoint(self):
@@ -10,7 +10,6 @@ import numpy as np
 import heapq
 import time
 import os
-import re
 
 
 from pyboy.api.tilemap import TileMap
@@ -37,6 +36,12 @@ defaults = {
 	"log_level": "DEBUG",
 }
 
+# Keyword arguments accepted by the plugins. The plugins and their arguments are fixed, so this is only built once.
+# The slice end is spelled out, as this module is compiled with wraparound disabled.
+_PLUGIN_KEYWORDS = frozenset(
+	z.strip("-").replace("-", "_") for x in parser_arguments() if x for y in x for z in y[:len(y) - 1]
+)
+
 class PyBoy:
 	"""
 	- * gamerom (str): Filepath to a game-ROM for Game Boy or Game Boy Color.
@@ -59,7 +64,7 @@ class PyBoy:
 		# get plugins args
 		for k, v in defaults.items():
 			if k not in kwargs:
-				kwargs[k] = kwargs.get(k, defaults[k])
+				kwargs[k] = v
 		# setup logging level
 		log_level(kwargs.pop("log_level"))
 		# check rom file
@@ -69,22 +74,23 @@ class PyBoy:
 		# create Motherboard
 		self.mb = Motherboard(gamerom, bootrom, kwargs["color_palette"], kwargs["cgb_color_palette"], sound, sound_emulated, cgb, randomize=randomize,)
 		# Validate all kwargs
-		plugin_manager_keywords = []
-		for x in parser_arguments():
-			if not x:
-				continue
-			plugin_manager_keywords.extend(z.strip("-").replace("-", "_") for y in x for z in y[:-1])
-		for k, v in kwargs.items():
-			if k not in defaults and k not in plugin_manager_keywords:
+		for k in kwargs:
+			if k not in defaults and k not in _PLUGIN_KEYWORDS:
 				logger.error("Unknown keyword argument: %s", k)
 				raise KeyError(f"Unknown keyword argument: {k}")
-		# Performance measures
+		# Performance measures. The time spent is summed up in nanoseconds for each frame, and only turned into
+		# averages when the window title is updated.
 		self.avg_pre = 0
 		self.avg_tick = 0
 		self.avg_post = 0
+		self._ns_pre = 0
+		self._ns_tick = 0
+		self._ns_post = 0
+		self._ns_frames = 0
 		# Absolute frame count of the emulation
 		self.frame_count = 0
 		self.paused = False
+		self._disable_renderer = self.mb.lcd.disable_renderer
 		self.events = []
 		self.queued_input = []
 		self.quitting = False
@@ -94,6 +100,15 @@ class PyBoy:
 		# [alex] API attributes
 		# self._hooks = {}
 		self._plugin_manager = PluginManager(self, self.mb, kwargs)
+		# Events handled here. Everything else goes to the motherboard as a button event.
+		self._event_handlers = {
+			WindowEvent.QUIT: self._quit,
+			WindowEvent.PASS: lambda: None, # Used in place of None in Cython, when key isn't mapped to anything
+			WindowEvent.PAUSE_TOGGLE: self._pause_toggle,
+			WindowEvent.PAUSE: self._pause,
+			WindowEvent.UNPAUSE: self._unpause,
+			WindowEvent._INTERNAL_RENDERER_FLUSH: self._plugin_manager._post_tick_windows,
+		}
 		self.initialized = True
 
 	"""
@@ -118,51 +133,61 @@ class PyBoy:
 			count -= 1
 		return running
 
+	"""
+	- Runs the emulator one frame at a time until it is told to quit, for example by closing the window.
+	- Front-ends can call this instead of looping over `PyBoy.tick` themselves. Call `PyBoy.stop` afterwards.
+	"""
+	def run_until_stop(self):
+		_tick = self._tick
+		while _tick(True):
+			pass
+
 	def _tick(self, render):
 		if self.stopped:
 			return False
-		t_start = time.perf_counter_ns()
+		now = time.perf_counter_ns
+		t_start = now()
 		self._handle_events(self.events)
-		t_pre = time.perf_counter_ns()
+		t_pre = now()
 		if not self.paused:
 			self.__rendering(render)
 			# Reenter mb.tick until we eventually get a clean exit without breakpoints
-			while self.mb.tick():
-				pass	
+			mb_tick = self.mb.tick
+			while mb_tick():
+				pass
 			self.frame_count += 1
-		t_tick = time.perf_counter_ns()
+		t_tick = now()
 		self._post_tick()
-		t_post = time.perf_counter_ns()
+		t_post = now()
 		# calc performance measures
-		nsecs = t_pre - t_start
-		self.avg_pre = 0.9 * self.avg_pre + (0.1*nsecs/1_000_000_000)
-		nsecs = t_tick - t_pre
-		self.avg_tick = 0.9 * self.avg_tick + (0.1*nsecs/1_000_000_000)
-		nsecs = t_post - t_tick
-		self.avg_post = 0.9 * self.avg_post + (0.1*nsecs/1_000_000_000)
+		self._ns_pre += t_pre - t_start
+		self._ns_tick += t_tick - t_pre
+		self._ns_post += t_post - t_tick
+		self._ns_frames += 1
 		return not self.quitting
 
 	def _handle_events(self, events):
 		# This feeds events into the tick-loop from the window. There might already be events in the list from the API.
 		events = self._plugin_manager.handle_events(events)
+		if not events:
+			# Most frames come without any input
+			return
+		event_handlers = self._event_handlers
 		for event in events:
-			if event == WindowEvent.QUIT:
-				self.quitting = True
-			elif event == WindowEvent.PASS:
-				pass # Used in place of None in Cython, when key isn't mapped to anything
-			elif event == WindowEvent.PAUSE_TOGGLE:
-				if self.paused:
-					self._unpause()
-				else:
-					self._pause()
-			elif event == WindowEvent.PAUSE:
-				self._pause()
-			elif event == WindowEvent.UNPAUSE:
-				self._unpause()
-			elif event == WindowEvent._INTERNAL_RENDERER_FLUSH:
-				self._plugin_manager._post_tick_windows()
-			else:
+			handler = event_handlers.get(int(event))
+			if handler is None:
 				self.mb.buttonevent(event)
+			else:
+				handler()
+
+	def _quit(self):
+		self.quitting = True
+
+	def _pause_toggle(self):
+		if self.paused:
+			self._unpause()
+		else:
+			self._pause()
 
 	def _pause(self):
 		if self.paused:
@@ -181,22 +206,35 @@ class PyBoy:
 	def _post_tick(self):
 		if self.frame_count % 60 == 0:
 			self._update_window_title()
-		self._plugin_manager.post_tick()
-		self._plugin_manager.frame_limiter(1)
+		plugin_manager = self._plugin_manager
+		plugin_manager.post_tick()
+		plugin_manager.frame_limiter(1)
 
-		# Prepare an empty list, as the API might be used to send in events between ticks
-		self.events = []
+		# Empty the list, as the API might be used to send in events between ticks. It's cleared in place, so the same
+		# list is used for the whole run.
+		self.events.clear()
 		while self.queued_input and self.frame_count == self.queued_input[0][0]:
 			_, _event = heapq.heappop(self.queued_input)
 			self.events.append(WindowEvent(_event))
 
 	def _update_window_title(self):
+		if self._ns_frames:
+			# Average seconds per frame since the last update
+			scale = self._ns_frames * 1_000_000_000
+			self.avg_pre = self._ns_pre / scale
+			self.avg_tick = self._ns_tick / scale
+			self.avg_post = self._ns_post / scale
+			self._ns_pre = self._ns_tick = self._ns_post = self._ns_frames = 0
 		avg_emu = self.avg_pre + self.avg_tick + self.avg_post
-		self.window_title = f"CPU/frame: {(self.avg_pre + self.avg_tick) / SPF * 100:0.2f}%"
-		self.window_title += f' Emulation: x{(round(SPF / avg_emu) if avg_emu > 0 else "INF")}'
+		title = f"CPU/frame: {(self.avg_pre + self.avg_tick) / SPF * 100:0.2f}%"
+		title += f' Emulation: x{(round(SPF / avg_emu) if avg_emu > 0 else "INF")}'
 		if self.paused:
-			self.window_title += "[PAUSED]"
-		self.window_title += self._plugin_manager.window_title()
+			title += "[PAUSED]"
+		title += self._plugin_manager.window_title()
+		# Setting the title goes all the way to the window, so it's skipped when nothing changed
+		if title == self.window_title:
+			return
+		self.window_title = title
 		self._plugin_manager._set_title()
 
 	def __del__(self):
@@ -221,7 +259,11 @@ class PyBoy:
 		return self.mb.getserial()
 
 	def __rendering(self, value):
-		self.mb.lcd.disable_renderer = not value
+		# Latched here, so the LCD is only written to when rendering is switched on or off
+		disable_renderer = not value
+		if disable_renderer != self._disable_renderer:
+			self._disable_renderer = disable_renderer
+			self.mb.lcd.disable_renderer = disable_renderer
 
 	def _is_cpu_stuck(self):
 		return self.mb.cpu.is_stuck
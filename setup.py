@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*- 
+#!/usr/bin/env python
+#
+# `python setup.py build_ext --inplace` compiles the CPU, the memory bank controller hot path, the scanline kernels and
+# the PyBoy frame loop with Cython. Each of them has a plain Python version, so without Cython (or without a compiler)
+# the emulator runs from source unchanged.
+#
+# Extra compiler and linker flags for the extensions can be given in PGO_CFLAGS. `make pgo` uses it for a profile-guided
+# build.
+#
+import os
+import shlex
+
+from setuptools import find_packages, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+CYTHON_MODULES = [
+    "pyboy/core/cpu.py",
+    "pyboy/core/cartridge/base_mbc.py",
+    "pyboy/core/scanline.pyx",
+    # PyBoy stays a regular Python class, as plugins and the API add to it. Compiling it still takes the interpreter
+    # out of the code run for every frame, like _tick and _handle_events.
+    "pyboy/pyboy.py",
+]
+
+if cythonize is not None:
+    ext_modules = cythonize(
+        CYTHON_MODULES,
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+        },
+    )
+    pgo_cflags = shlex.split(os.environ.get("PGO_CFLAGS", ""))
+    for ext in ext_modules:
+        ext.extra_compile_args += pgo_cflags
+        ext.extra_link_args += pgo_cflags
+else:
+    ext_modules = []
+
+setup(
+    name="pyboy",
+    packages=find_packages(include=["pyboy", "pyboy.*"]),
+    package_data={
+        "pyboy.core": ["*.bin", "*.pxd"],
+        "pyboy.core.cartridge": ["*.pxd"],
+        "pyboy.plugins": ["font.txt"],
+    },
+    install_requires=["numpy", "pysdl2", "click"],
+    ext_modules=ext_modules,
+    zip_safe=False,
+)